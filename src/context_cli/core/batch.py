@@ -5,23 +5,32 @@ from __future__ import annotations
 import asyncio
 import csv
 import io
+import os
 from collections.abc import Callable
+from typing import TextIO
 
 from context_cli.core.auditor import audit_site, audit_url
 from context_cli.core.models import AuditReport, BatchAuditReport, SiteAuditReport
 
 
-def parse_url_file(path: str) -> list[str]:
-    """Read URLs from a .txt or .csv file.
+def parse_url_file(source: str | os.PathLike[str] | TextIO) -> list[str]:
+    """Read URLs from a .txt or .csv file, given a path or an open text stream.
 
     - Skips empty lines and lines starting with #
     - For .csv files, uses the first column as URL (skips header if present)
     - Auto-prepends https:// to URLs without a scheme
-    """
-    with open(path) as f:
-        raw = f.read()
 
-    if path.endswith(".csv"):
+    Streams are parsed as CSV when their ``name`` ends in ``.csv``.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        name = os.fspath(source)
+        with open(name) as f:
+            raw = f.read()
+    else:
+        name = str(getattr(source, "name", ""))
+        raw = source.read()
+
+    if name.endswith(".csv"):
         return _parse_csv(raw)
     return _parse_txt(raw)
 
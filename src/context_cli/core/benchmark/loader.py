@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import csv
 import io
+import os
+from typing import TextIO
 
 from context_cli.core.models import PromptEntry
 
@@ -40,16 +42,19 @@ def _parse_text(content: str) -> list[PromptEntry]:
     return prompts
 
 
-def load_prompts(path: str) -> list[PromptEntry]:
-    """Load benchmark prompts from a CSV or plain text file.
+def load_prompts(source: str | os.PathLike[str] | TextIO) -> list[PromptEntry]:
+    """Load benchmark prompts from a CSV or plain text file, given a path or an open text stream.
 
     CSV format: must have a 'prompt' column header. Optional 'category' and 'intent' columns.
     Text format: one prompt per line (any file without a 'prompt' header).
 
     Raises FileNotFoundError if the file does not exist.
     """
-    with open(path) as f:
-        content = f.read()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as f:
+            content = f.read()
+    else:
+        content = source.read()
 
     if not content.strip():
         return []
@@ -72,13 +77,13 @@ def validate_prompts(prompts: list[PromptEntry]) -> list[PromptEntry]:
         prompt_text = entry.prompt.strip()
         if not prompt_text:
             continue
-        category = entry.category.strip() if entry.category else None
-        if category == "":
-            category = None
-        intent = entry.intent.strip() if entry.intent else None
-        if intent == "":
-            intent = None
+        # The fields come from an already-validated PromptEntry and stay str | None,
+        # so the cleaned copy skips a second round of validation.
         validated.append(
-            PromptEntry(prompt=prompt_text, category=category, intent=intent)
+            PromptEntry.model_construct(
+                prompt=prompt_text,
+                category=(entry.category or "").strip() or None,
+                intent=(entry.intent or "").strip() or None,
+            )
         )
     return validated
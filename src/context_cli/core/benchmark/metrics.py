@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+
 from context_cli.core.models import (
     BenchmarkConfig,
     BenchmarkReport,
@@ -18,45 +20,31 @@ def compute_model_summary(
     """Compute aggregated metrics for a single model from benchmark results.
 
     Filters results for the specified model. Skips results without judge_result.
-    Calculates mention_rate, recommendation_rate, avg_position, and sentiment_breakdown.
+    Calculates mention_rate, recommendation_rate, avg_position, and sentiment_breakdown
+    in a single pass over the results.
     """
-    model_results = [r for r in results if r.model == model and r.judge_result is not None]
-    total = len(model_results)
-
-    if total == 0:
-        return ModelBenchmarkSummary(
-            model=model,
-            mention_rate=0.0,
-            recommendation_rate=0.0,
-            avg_position=None,
-            sentiment_breakdown={"positive": 0, "neutral": 0, "negative": 0},
-        )
-
-    mentions = sum(
-        1 for r in model_results if brand in r.judge_result.brands_mentioned  # type: ignore[union-attr, misc]
-    )
-    recommendations = sum(
-        1 for r in model_results if r.judge_result.recommended_brand == brand  # type: ignore[union-attr, misc]
-    )
-
-    positions = [
-        r.judge_result.target_brand_position  # type: ignore[union-attr]
-        for r in model_results
-        if r.judge_result.target_brand_position is not None  # type: ignore[union-attr]
-    ]
-    avg_pos = sum(positions) / len(positions) if positions else None
-
+    total = mentions = recommendations = position_count = position_sum = 0
     sentiment: dict[str, int] = {"positive": 0, "neutral": 0, "negative": 0}
-    for r in model_results:
-        s = r.judge_result.sentiment  # type: ignore[union-attr]
-        if s in sentiment:
-            sentiment[s] += 1
+    for r in results:
+        judged = r.judge_result
+        if r.model != model or judged is None:
+            continue
+        total += 1
+        if brand in judged.brands_mentioned:
+            mentions += 1
+        if judged.recommended_brand == brand:
+            recommendations += 1
+        if judged.target_brand_position is not None:
+            position_count += 1
+            position_sum += judged.target_brand_position
+        if judged.sentiment in sentiment:
+            sentiment[judged.sentiment] += 1
 
     return ModelBenchmarkSummary(
         model=model,
-        mention_rate=mentions / total,
-        recommendation_rate=recommendations / total,
-        avg_position=avg_pos,
+        mention_rate=mentions / total if total else 0.0,
+        recommendation_rate=recommendations / total if total else 0.0,
+        avg_position=position_sum / position_count if position_count else None,
         sentiment_breakdown=sentiment,
     )
 
@@ -69,16 +57,19 @@ def compute_report(
 
     Computes per-model summaries and overall weighted averages.
     """
+    # Bucket results by model once instead of rescanning them for every model.
+    by_model: dict[str, list[PromptBenchmarkResult]] = defaultdict(list)
+    for r in results:
+        by_model[r.model].append(r)
+
     summaries = [
-        compute_model_summary(results, model=m, brand=config.brand) for m in config.models
+        compute_model_summary(by_model[m], model=m, brand=config.brand) for m in config.models
     ]
 
     # Count judged results per model for weighting
-    judged_counts: dict[str, int] = {}
-    for m in config.models:
-        judged_counts[m] = len(
-            [r for r in results if r.model == m and r.judge_result is not None]
-        )
+    judged_counts: dict[str, int] = {
+        m: sum(1 for r in by_model[m] if r.judge_result is not None) for m in config.models
+    }
 
     total_judged = sum(judged_counts.values())
 
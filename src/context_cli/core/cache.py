@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 from context_cli.core.models import RobotsReport
@@ -12,18 +13,28 @@ class RobotsCache:
     """Cache robots.txt results to avoid re-fetching for every page in a site audit.
 
     Keyed by domain (netloc). A single site audit typically only needs one entry,
-    but the design supports multi-domain usage if needed.
+    but the design supports multi-domain usage if needed. Holds at most *maxsize*
+    domains, evicting the least recently used one when full.
     """
 
-    _store: dict[str, tuple[RobotsReport, str | None]] = field(default_factory=dict)
+    maxsize: int = 1024
+    _store: OrderedDict[str, tuple[RobotsReport, str | None]] = field(
+        default_factory=OrderedDict
+    )
 
     def get(self, domain: str) -> tuple[RobotsReport, str | None] | None:
         """Return cached (RobotsReport, raw_text) or None if not cached."""
-        return self._store.get(domain)
+        entry = self._store.get(domain)
+        if entry is not None:
+            self._store.move_to_end(domain)
+        return entry
 
     def set(self, domain: str, report: RobotsReport, raw_text: str | None) -> None:
         """Cache a robots.txt result for a domain."""
         self._store[domain] = (report, raw_text)
+        self._store.move_to_end(domain)
+        if len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
 
     def has(self, domain: str) -> bool:
         """Check if a domain's robots.txt is cached."""
@@ -7,6 +7,8 @@ import re
 from context_cli.core.models import ContentReport
 
 _VOWELS = re.compile(r"[aeiou]+", re.IGNORECASE)
+_HEADING_LINE = re.compile(r"^#{1,6}\s.*$", re.MULTILINE)
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s")
 
 
 def _count_syllables(word: str) -> int:
@@ -57,16 +59,16 @@ def _answer_first_ratio(markdown: str) -> float:
     """
     if not markdown.strip():
         return 0.0
-    sections = re.split(r"^#{1,6}\s.*$", markdown, flags=re.MULTILINE)
-    non_empty = [s.strip() for s in sections if s.strip()]
+    non_empty = [s for s in (s.strip() for s in _HEADING_LINE.split(markdown)) if s]
     if not non_empty:
         return 0.0
+    search = _SENTENCE_BREAK.search
     answer_first = 0
     for section in non_empty:
-        # Extract first sentence: split on sentence-ending punctuation
-        sentences = re.split(r"(?<=[.!?])\s", section, maxsplit=1)
-        first = sentences[0].strip()
-        if first and not first.rstrip().endswith("?"):
+        # First sentence runs up to the first punctuation followed by whitespace
+        m = search(section)
+        first = section[: m.start()] if m else section
+        if not first.endswith("?"):
             answer_first += 1
     return round(answer_first / len(non_empty), 2)
 
@@ -76,7 +78,7 @@ def _analyze_chunks(markdown: str) -> tuple[int, int, int]:
 
     Returns (chunk_count, avg_chunk_words, chunks_in_sweet_spot).
     """
-    chunks = re.split(r"^#{1,6}\s.*$", markdown, flags=re.MULTILINE)
+    chunks = _HEADING_LINE.split(markdown)
     # Filter out empty/whitespace-only chunks
     chunk_words = [len(c.split()) for c in chunks if c.strip()]
     chunk_count = len(chunk_words)
@@ -4,17 +4,20 @@ from __future__ import annotations
 
 import json
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from context_cli.core.models import SchemaOrgResult, SchemaReport
 
+# Only JSON-LD script tags matter here, so skip building the rest of the tree.
+_LD_JSON_SCRIPTS = SoupStrainer("script", attrs={"type": "application/ld+json"})
+
 
 def check_schema_org(html: str) -> SchemaReport:  # noqa: C901
     """Extract and analyze JSON-LD structured data from HTML."""
     if not html:
         return SchemaReport(detail="No HTML to analyze")
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "html.parser", parse_only=_LD_JSON_SCRIPTS)
     ld_scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
 
     schemas: list[SchemaOrgResult] = []
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
 import re
 from urllib.parse import urlparse
@@ -38,10 +39,16 @@ def _sanitize_url_to_dirname(url: str) -> str:
     return sanitized.strip("_")
 
 
-async def generate_batch(config: BatchGenerateConfig) -> BatchGenerateResult:
+async def generate_batch(
+    config: BatchGenerateConfig,
+    *,
+    shared_limit: asyncio.Semaphore | None = None,
+) -> BatchGenerateResult:
     """Batch generate llms.txt + schema.jsonld for multiple URLs.
 
-    Uses asyncio.Semaphore for concurrency control.
+    Uses asyncio.Semaphore for concurrency control. When *shared_limit* is
+    given, each URL must also hold it, bounding the total number of in-flight
+    generations across concurrent batches (e.g. simultaneous MCP calls).
     Each URL's output goes to output_dir/{sanitized_url}/.
     Failures are captured per-URL; one failure does not kill the batch.
     """
@@ -57,7 +64,7 @@ async def generate_batch(config: BatchGenerateConfig) -> BatchGenerateResult:
             model=model,
             output_dir=url_output_dir,
         )
-        async with semaphore:
+        async with semaphore, shared_limit or contextlib.nullcontext():
             try:
                 result = await generate_assets(per_url_config)
                 return BatchPageResult(
@@ -29,6 +29,10 @@ CREATE INDEX IF NOT EXISTS idx_audits_url ON audits (url);
 CREATE INDEX IF NOT EXISTS idx_audits_timestamp ON audits (timestamp);
 """
 
+# URLs bound per list_entries_batch query; keeps the statement under SQLite's
+# historical 999 host-parameter limit (SQLITE_MAX_VARIABLE_NUMBER).
+_BATCH_QUERY_URLS = 900
+
 
 class HistoryEntry(BaseModel):
     """A single audit history entry."""
@@ -89,6 +93,36 @@ class HistoryDB:
         ).fetchall()
         return [HistoryEntry(**dict(r)) for r in rows]
 
+    def list_entries_batch(
+        self, urls: list[str], limit: int = 20
+    ) -> dict[str, list[HistoryEntry]]:
+        """List recent entries for several URLs, newest first per URL.
+
+        Every requested URL is a key in the result, with an empty list if it has
+        no history. *limit* applies per URL with the same meaning as in
+        list_entries (a negative value means no limit).
+        """
+        grouped: dict[str, list[HistoryEntry]] = {url: [] for url in urls}
+        unique = list(grouped)
+        for start in range(0, len(unique), _BATCH_QUERY_URLS):
+            chunk = unique[start : start + _BATCH_QUERY_URLS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"""SELECT id, url, timestamp, overall_score, robots_score,
+                           llms_txt_score, schema_org_score, content_score
+                    FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY url ORDER BY timestamp DESC
+                        ) AS row_num
+                        FROM audits WHERE url IN ({placeholders})
+                    )
+                    WHERE ? < 0 OR row_num <= ? ORDER BY url, row_num""",
+                (*chunk, limit, limit),
+            ).fetchall()
+            for r in rows:
+                grouped[r["url"]].append(HistoryEntry(**dict(r)))
+        return grouped
+
     def get_report(self, entry_id: int) -> AuditReport | None:
         """Retrieve the full audit report for a given entry ID."""
         row = self._conn.execute(
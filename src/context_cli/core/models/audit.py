@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .agent_readiness import AgentReadinessReport
 from .content import ContentReport
@@ -15,6 +15,8 @@ from .signals import ContentUsageReport, EeatReport, RslReport
 class LintCheck(BaseModel):
     """Result of a single lint check."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Check name (e.g., 'AI Primitives')")
     passed: bool = Field(description="Whether the check passed")
     detail: str = Field(default="", description="Human-readable detail")
@@ -26,6 +28,8 @@ class LintCheck(BaseModel):
 class Diagnostic(BaseModel):
     """A single diagnostic message (linter-style)."""
 
+    model_config = ConfigDict(frozen=True)
+
     code: str = Field(description="Diagnostic code (e.g., WARN-001)")
     severity: str = Field(description="Severity: error, warn, or info")
     message: str = Field(description="Human-readable diagnostic message")
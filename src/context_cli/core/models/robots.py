@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BotAccessResult(BaseModel):
     """Result of checking a single AI bot's access in robots.txt."""
 
+    model_config = ConfigDict(frozen=True)
+
     bot: str = Field(description="Name of the AI bot (e.g., GPTBot, ClaudeBot)")
     allowed: bool = Field(description="Whether the bot is allowed by robots.txt")
     detail: str = Field(default="", description="Additional detail (e.g., Disallow rule found)")
@@ -22,3 +24,8 @@ class RobotsReport(BaseModel):
     )
     score: float = Field(default=0, description="Robots pillar score (0-25)")
     detail: str = Field(default="", description="Summary of robots.txt findings")
+
+    @property
+    def allowed_count(self) -> int:
+        """Number of checked bots that robots.txt allows."""
+        return sum(b.allowed for b in self.bots)
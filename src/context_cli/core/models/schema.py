@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SchemaOrgResult(BaseModel):
     """A single JSON-LD structured data block found in the page."""
 
+    model_config = ConfigDict(frozen=True)
+
     schema_type: str = Field(description="The @type value (e.g., Organization, Article)")
     properties: list[str] = Field(
         default_factory=list, description="Top-level property names found"
@@ -23,3 +25,8 @@ class SchemaReport(BaseModel):
     )
     score: float = Field(default=0, description="Schema pillar score (0-25)")
     detail: str = Field(default="", description="Summary of schema findings")
+
+    @property
+    def unique_types(self) -> frozenset[str]:
+        """Distinct @type values across all parsed blocks."""
+        return frozenset(s.schema_type for s in self.schemas)
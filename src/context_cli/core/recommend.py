@@ -103,8 +103,7 @@ def _schema_recommendations(report: AuditReport) -> list[Recommendation]:
     if gap <= 0:
         return recs
 
-    existing_types = {s.schema_type for s in schema.schemas}
-    missing_high_value = HIGH_VALUE_TYPES - existing_types
+    missing_high_value = HIGH_VALUE_TYPES - schema.unique_types
 
     if schema.blocks_found == 0:
         suggested = ", ".join(sorted(missing_high_value)[:3])
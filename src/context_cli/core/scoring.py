@@ -101,8 +101,7 @@ def compute_scores(
     """
     # Robots: max ROBOTS_MAX — proportional to bots allowed
     if robots.found and robots.bots:
-        allowed = sum(1 for b in robots.bots if b.allowed)
-        robots.score = round(ROBOTS_MAX * allowed / len(robots.bots), 1)
+        robots.score = round(ROBOTS_MAX * robots.allowed_count / len(robots.bots), 1)
     else:
         robots.score = 0
 
@@ -113,7 +112,7 @@ def compute_scores(
 
     # Schema: max SCHEMA_MAX — reward high-value types more
     if schema_org.blocks_found > 0:
-        unique_types = {s.schema_type for s in schema_org.schemas}
+        unique_types = schema_org.unique_types
         high = sum(1 for t in unique_types if t in HIGH_VALUE_TYPES)
         std = len(unique_types) - high
         schema_org.score = min(
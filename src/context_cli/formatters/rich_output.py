@@ -13,7 +13,7 @@ from context_cli.core.models import (
     LintResult,
     SiteAuditReport,
 )
-from context_cli.formatters.verbose import overall_color, score_color
+from context_cli.formatters.verbose import overall_color, score_color, score_colorer
 
 # ── Linter-style helpers ────────────────────────────────────────────────────
 
@@ -174,12 +174,14 @@ def render_site_report(report: SiteAuditReport, console: Console) -> None:
         page_table.add_column("Schema", justify="right")
         page_table.add_column("Content", justify="right")
         page_table.add_column("Total", justify="right")
+        schema_color = score_colorer("schema_org")
+        content_color = score_colorer("content")
         for page in report.pages:
             total = page.schema_org.score + page.content.score
             page_table.add_row(
                 page.url,
-                score_color(page.schema_org.score, "schema_org"),
-                score_color(page.content.score, "content"),
+                schema_color(page.schema_org.score),
+                content_color(page.content.score),
                 Text(f"{total}", style=overall_color(total)),
             )
         console.print(page_table)
@@ -236,28 +238,28 @@ def render_batch_rich(
         ar_score = ""
         if has_agent:
             ar_score = (
-                f"{report.agent_readiness.score}"
+                str(report.agent_readiness.score)
                 if report.agent_readiness
                 else "-"
             )
         if has_agent:
             table.add_row(
                 report.url,
-                Text(f"{report.overall_score}", style=color),
-                f"{report.robots.score}",
-                f"{report.llms_txt.score}",
-                f"{report.schema_org.score}",
-                f"{report.content.score}",
+                Text(str(report.overall_score), style=color),
+                str(report.robots.score),
+                str(report.llms_txt.score),
+                str(report.schema_org.score),
+                str(report.content.score),
                 ar_score,
             )
         else:
             table.add_row(
                 report.url,
-                Text(f"{report.overall_score}", style=color),
-                f"{report.robots.score}",
-                f"{report.llms_txt.score}",
-                f"{report.schema_org.score}",
-                f"{report.content.score}",
+                Text(str(report.overall_score), style=color),
+                str(report.robots.score),
+                str(report.llms_txt.score),
+                str(report.schema_org.score),
+                str(report.content.score),
             )
 
     console.print(table)
@@ -6,6 +6,8 @@ explanations into the full --verbose CLI output.
 
 from __future__ import annotations
 
+import io
+from collections.abc import Callable
 from urllib.parse import urlparse
 
 from rich.console import Console
@@ -34,6 +36,7 @@ from context_cli.formatters.verbose_panels import (
     render_schema_verbose,
     render_token_analysis_verbose,
     score_color,
+    score_colorer,
 )
 
 # Re-export public API so existing consumers can import from this module
@@ -54,37 +57,42 @@ __all__ = [
     "render_verbose_single",
     "render_verbose_site",
     "score_color",
+    "score_colorer",
 ]
 
 
 # ── Compositors ─────────────────────────────────────────────────────────────
 
+# Scored pillars are always present on a report, so their panels always render
+_SCORED_PANELS: tuple[Callable[[AuditReport | SiteAuditReport], Panel], ...] = (
+    render_robots_verbose,
+    render_llms_verbose,
+    render_schema_verbose,
+    render_content_verbose,
+)
+
+# Informational panels in display order, keyed by the optional report attribute
+# they render; a renderer is only called when its attribute is set
+_INFORMATIONAL_PANELS: tuple[
+    tuple[str, Callable[[AuditReport | SiteAuditReport], Panel | None]], ...
+] = (
+    ("lint_result", render_token_analysis_verbose),  # token analysis shown first
+    ("agent_readiness", render_agent_readiness_verbose),
+    ("rsl", render_rsl_verbose),
+    ("content_usage", render_content_usage_verbose),
+    ("eeat", render_eeat_verbose),
+)
+
 
 def _render_informational_panels(
     report: AuditReport | SiteAuditReport, console: Console,
 ) -> None:
     """Render informational signal panels if present."""
-    # Token analysis panel (shown first among informational panels)
-    token_panel = render_token_analysis_verbose(report)
-    if token_panel:
-        console.print(token_panel)
-
-    # Agent readiness panel
-    ar_panel = render_agent_readiness_verbose(report)
-    if ar_panel:
-        console.print(ar_panel)
-
-    rsl_panel = render_rsl_verbose(report)
-    if rsl_panel:
-        console.print(rsl_panel)
-
-    cu_panel = render_content_usage_verbose(report)
-    if cu_panel:
-        console.print(cu_panel)
-
-    eeat_panel = render_eeat_verbose(report)
-    if eeat_panel:
-        console.print(eeat_panel)
+    for attr, render in _INFORMATIONAL_PANELS:
+        if getattr(report, attr) is not None:
+            panel = render(report)
+            if panel:
+                console.print(panel)
 
 
 def render_verbose_single(report: AuditReport, console: Console) -> None:
@@ -96,10 +104,8 @@ def render_verbose_single(report: AuditReport, console: Console) -> None:
         "+ Schema (25pts) + llms.txt (10pts) = 100pts max"
     )
 
-    console.print(render_robots_verbose(report))
-    console.print(render_llms_verbose(report))
-    console.print(render_schema_verbose(report))
-    console.print(render_content_verbose(report))
+    for render in _SCORED_PANELS:
+        console.print(render(report))
 
     _render_informational_panels(report, console)
 
@@ -119,13 +125,9 @@ def render_verbose_site(
         "+ Schema (25pts) + llms.txt (10pts) = 100pts max"
     )
 
-    # Site-wide panels (robots + llms.txt are the same across the site)
-    console.print(render_robots_verbose(report))
-    console.print(render_llms_verbose(report))
-
-    # Aggregated schema + content panels
-    console.print(render_schema_verbose(report))
-    console.print(render_content_verbose(report))
+    # Site-wide robots + llms.txt panels, then aggregated schema + content panels
+    for render in _SCORED_PANELS:
+        console.print(render(report))
 
     # Per-page breakdown panels
     if report.pages:
@@ -188,38 +190,30 @@ def _render_aggregation_explanation(
     if not report.pages:
         return
 
-    lines = [
-        "[bold]Score Aggregation Method[/bold]",
-        "",
-        "  Per-page scores (Schema + Content) are weighted by URL depth:",
-        "    Depth 0-1 (homepage, top sections): weight 3",
-        "    Depth 2: weight 2",
-        "    Depth 3+: weight 1",
-        "",
-        "  Robots.txt and llms.txt scores are site-wide (not averaged).",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w("[bold]Score Aggregation Method[/bold]\n\n")
+    w("  Per-page scores (Schema + Content) are weighted by URL depth:\n")
+    w("    Depth 0-1 (homepage, top sections): weight 3\n")
+    w("    Depth 2: weight 2\n")
+    w("    Depth 3+: weight 1\n\n")
+    w("  Robots.txt and llms.txt scores are site-wide (not averaged).\n")
 
     # Show the actual weights used
-    weight_lines: list[str] = []
+    w("\n")
     for page in report.pages:
         path = urlparse(page.url).path.strip("/")
         depth = len(path.split("/")) if path else 0
         if depth <= 1:
-            w = 3
+            weight = 3
         elif depth == 2:
-            w = 2
+            weight = 2
         else:
-            w = 1
-        weight_lines.append(
-            f"    {page.url}: depth {depth} \u2192 weight {w}"
-        )
-
-    if weight_lines:
-        lines.append("")
-        lines.extend(weight_lines)
+            weight = 1
+        w(f"    {page.url}: depth {depth} \u2192 weight {weight}\n")
 
     console.print(Panel(
-        "\n".join(lines),
+        buf.getvalue().rstrip("\n"),
         title="Aggregation Detail",
         border_style="blue",
     ))
@@ -7,7 +7,14 @@ Informational signal panels (RSL, Content-Usage, E-E-A-T) use blue borders.
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Callable
+from functools import lru_cache
+
+from rich.console import Group, RenderableType
+from rich.padding import Padding
 from rich.panel import Panel
+from rich.table import Table
 from rich.text import Text
 
 from context_cli.core.models import (
@@ -40,75 +47,169 @@ PILLAR_MAX: dict[str, int] = {
 }
 
 
+# Status markup indexed by a bool (False → 0, True → 1)
+_YES_NO: tuple[str, str] = ("[red]No[/red]", "[green]Yes[/green]")
+
+# The scored pillar panels are assembled from pre-styled (text, style) segments
+# rather than markup strings, so Rich never runs its markup parser on them.
+_Segment = str | tuple[str, str]
+_YES_NO_SEGMENT: tuple[_Segment, _Segment] = (("No", "red"), ("Yes", "green"))
+_PASS_FAIL_SEGMENT: tuple[tuple[str, str], tuple[str, str]] = (
+    ("FAIL", "red"),
+    ("PASS", "green"),
+)
+_WARN_SEGMENT: tuple[str, str] = ("WARN", "yellow")
+_ALLOWED_SEGMENT: tuple[_Segment, _Segment] = (("Blocked", "red"), ("Allowed", "green"))
+
+# Bodies and panels whose text never depends on the report, built once at import
+_LLMS_NOT_FOUND_BODY: tuple[_Segment, ...] = (
+    "  ",
+    ("Not found", "red"),
+    "\n  Paths checked: /llms.txt, /.well-known/llms.txt",
+)
+_RSL_HEADING = "[bold]RSL Analysis[/bold] [dim](informational — not scored)[/dim]"
+_TOKEN_ANALYSIS_HEADING = Text.assemble(
+    ("Token Analysis", "bold"), " ", ("(context efficiency metrics)", "dim")
+)
+_LINT_CHECKS_HEADING = Text.assemble("  ", ("Lint Checks:", "bold"))
+_DIAGNOSTICS_HEADING = Text.assemble("  ", ("Diagnostics:", "bold"))
+_BLANK = Text()
+_EEAT_HEADING = "[bold]E-E-A-T Signals[/bold] [dim](informational — not scored)[/dim]"
+_CU_HEADING = "[bold]Content-Usage Header[/bold] [dim](informational — not scored)[/dim]"
+_CU_NOT_FOUND_PANEL = Panel(
+    f"{_CU_HEADING}\n\n  [dim]Content-Usage header not found[/dim]",
+    title="Content-Usage Detail",
+    border_style="blue",
+)
+
+# Agent readiness sub-checks in display order: (report attribute, label, max points)
+_AGENT_SUB_CHECKS: tuple[tuple[str, str, int], ...] = (
+    ("agents_md", "AGENTS.md", 5),
+    ("markdown_accept", "Accept: text/markdown", 5),
+    ("mcp_endpoint", "MCP Endpoint", 4),
+    ("semantic_html", "Semantic HTML", 3),
+    ("x402", "x402 Payment", 2),
+    ("nlweb", "NLWeb", 1),
+)
+
+# Word tiers sorted by threshold, so the active tier is a bisect away
+_TIERS_ASCENDING: tuple[tuple[int, int], ...] = tuple(sorted(CONTENT_WORD_TIERS))
+_TIER_THRESHOLDS: tuple[int, ...] = tuple(min_words for min_words, _ in _TIERS_ASCENDING)
+
+
+def _build_tier_segments(active_min_words: int | None) -> tuple[_Segment, ...]:
+    """Return the content panel's word-tier lines with *active_min_words* highlighted."""
+    parts: list[_Segment] = []
+    for min_words, tier_score in CONTENT_WORD_TIERS:
+        if min_words == active_min_words:
+            tier = (f"→ {min_words}+ words = {tier_score} pts (active)", "green")
+        else:
+            tier = (f"  {min_words}+ words = {tier_score} pts", "dim")
+        parts += ("\n    ", tier)
+    if active_min_words is None:
+        parts += (
+            "\n    ",
+            (f"  < {_TIER_THRESHOLDS[0]} words = 0 pts (below minimum)", "red"),
+        )
+    return tuple(parts)
+
+
+# Every possible tier breakdown, indexed by bisect position + 1 (0 = below minimum)
+_TIER_SEGMENTS: tuple[tuple[_Segment, ...], ...] = (
+    _build_tier_segments(None),
+    *(_build_tier_segments(min_words) for min_words in _TIER_THRESHOLDS),
+)
+
+
 # ── Color helpers ────────────────────────────────────────────────────────────
 
 
+# Color per tenth of the max score: <40% red, <70% yellow, otherwise green
+_COLOR_BUCKETS: tuple[str, ...] = ("red",) * 4 + ("yellow",) * 3 + ("green",) * 4
+
+
+def _bucket_color(ratio: float) -> str:
+    """Return the threshold color for a 0-1 score ratio."""
+    return _COLOR_BUCKETS[min(10, max(0, int(ratio * 10)))]
+
+
+def _make_score_colorer(max_pts: int) -> Callable[[float], Text]:
+    """Build a memoized score colorer specialized for one pillar's max score.
+
+    The returned Text objects are shared between callers and must not be mutated.
+    ``typed=True`` keeps ``10`` and ``10.0`` apart, since they render differently.
+    """
+
+    @lru_cache(maxsize=128, typed=True)
+    def colorer(score: float) -> Text:
+        return Text(f"{score}", style=_bucket_color(score / max_pts) if max_pts else "red")
+
+    return colorer
+
+
+_SCORE_COLORERS: dict[str, Callable[[float], Text]] = {
+    pillar: _make_score_colorer(max_pts) for pillar, max_pts in PILLAR_MAX.items()
+}
+
+
+def score_colorer(pillar: str) -> Callable[[float], Text]:
+    """Return the score colorer for *pillar*, for callers coloring many scores."""
+    return _SCORE_COLORERS[pillar]
+
+
 def score_color(score: float, pillar: str) -> Text:
     """Return a Rich Text with the score colored by threshold (green/yellow/red)."""
-    max_pts = PILLAR_MAX[pillar]
-    ratio = score / max_pts if max_pts else 0
-    if ratio >= 0.7:
-        color = "green"
-    elif ratio >= 0.4:
-        color = "yellow"
-    else:
-        color = "red"
-    return Text(f"{score}", style=color)
+    return _SCORE_COLORERS[pillar](score)
 
 
 def overall_color(score: float) -> str:
     """Return a Rich color string for an overall 0-100 score."""
-    if score >= 70:
-        return "green"
-    elif score >= 40:
-        return "yellow"
-    return "red"
+    return _bucket_color(score / 100)
 
 
 def _border_color(score: float, max_pts: float) -> str:
     """Return a border color based on score ratio."""
-    ratio = score / max_pts if max_pts else 0
-    if ratio >= 0.7:
-        return "green"
-    elif ratio >= 0.4:
-        return "yellow"
-    return "red"
+    return _bucket_color(score / max_pts) if max_pts else "red"
 
 
 # ── Robots Verbose Panel ────────────────────────────────────────────────────
 
 
+def _heading(title: str, score: float, max_pts: int, color: str) -> tuple[_Segment, ...]:
+    """Return the styled "<title> — Score: x/max" segments opening a pillar panel."""
+    return ((title, "bold"), " — Score: ", (f"{score}", color), f"/{max_pts}\n\n")
+
+
 def render_robots_verbose(report: AuditReport | SiteAuditReport) -> Panel:
     """Render detailed robots.txt panel with per-bot details and scoring formula."""
     robots = report.robots
-    lines: list[str] = []
-
     color = _border_color(robots.score, ROBOTS_MAX)
-    score_text = f"[{color}]{robots.score}[/{color}]/{ROBOTS_MAX}"
-    lines.append(f"[bold]Robots.txt AI Bot Access[/bold] — Score: {score_text}")
+    parts: list[_Segment] = [*_heading("Robots.txt AI Bot Access", robots.score, ROBOTS_MAX, color)]
 
     if robots.found and robots.bots:
-        allowed_count = sum(1 for b in robots.bots if b.allowed)
-        total = len(robots.bots)
-        lines.append("")
-        lines.append(
-            f"  [dim]Formula:[/dim] {allowed_count}/{total} × {ROBOTS_MAX} = {robots.score}"
+        parts += (
+            "  ",
+            ("Formula:", "dim"),
+            f" {robots.allowed_count}/{len(robots.bots)} × {ROBOTS_MAX} = {robots.score}\n",
         )
-        lines.append("")
-        for bot in robots.bots:
-            status = "[green]Allowed[/green]" if bot.allowed else "[red]Blocked[/red]"
-            detail = f" — {bot.detail}" if bot.detail else ""
-            lines.append(f"  {bot.bot}: {status}{detail}")
+        parts += [
+            segment
+            for bot in robots.bots
+            for segment in (
+                f"\n  {bot.bot}: ",
+                _ALLOWED_SEGMENT[bot.allowed],
+                f" — {bot.detail}" if bot.detail else "",
+            )
+        ]
     else:
-        lines.append("")
-        lines.append("  [yellow]robots.txt not found or inaccessible[/yellow]")
-        lines.append("  [dim]All bots assumed allowed (score 0 — cannot verify access)[/dim]")
+        parts += (
+            "  ",
+            ("robots.txt not found or inaccessible", "yellow"),
+            "\n  ",
+            ("All bots assumed allowed (score 0 — cannot verify access)", "dim"),
+        )
 
-    return Panel(
-        "\n".join(lines),
-        title="Robots.txt Detail",
-        border_style=color,
-    )
+    return Panel(Text.assemble(*parts), title="Robots.txt Detail", border_style=color)
 
 
 # ── llms.txt Verbose Panel ──────────────────────────────────────────────────
@@ -118,24 +219,25 @@ def render_llms_verbose(report: AuditReport | SiteAuditReport) -> Panel:
     """Render detailed llms.txt panel with binary scoring explanation."""
     llms = report.llms_txt
     color = _border_color(llms.score, LLMS_TXT_MAX)
-    score_text = f"[{color}]{llms.score}[/{color}]/{LLMS_TXT_MAX}"
-    lines: list[str] = [f"[bold]llms.txt Presence[/bold] — Score: {score_text}"]
-
-    lines.append("")
-    lines.append(
-        f"  [dim]Scoring:[/dim] Binary — {LLMS_TXT_MAX} if found, 0 if not"
-    )
 
     if llms.found:
-        lines.append(f"  [green]Found at:[/green] {llms.url}")
-        if llms.detail:
-            lines.append(f"  Detail: {llms.detail}")
+        body: tuple[_Segment, ...] = (
+            "  ",
+            ("Found at:", "green"),
+            f" {llms.url}",
+            f"\n  Detail: {llms.detail}" if llms.detail else "",
+        )
     else:
-        lines.append("  [red]Not found[/red]")
-        lines.append("  Paths checked: /llms.txt, /.well-known/llms.txt")
+        body = _LLMS_NOT_FOUND_BODY
 
     return Panel(
-        "\n".join(lines),
+        Text.assemble(
+            *_heading("llms.txt Presence", llms.score, LLMS_TXT_MAX, color),
+            "  ",
+            ("Scoring:", "dim"),
+            f" Binary — {LLMS_TXT_MAX} if found, 0 if not\n",
+            *body,
+        ),
         title="llms.txt Detail",
         border_style=color,
     )
@@ -148,11 +250,10 @@ def render_schema_verbose(report: AuditReport | SiteAuditReport) -> Panel:
     """Render detailed Schema.org panel with formula and property names."""
     schema = report.schema_org
     color = _border_color(schema.score, SCHEMA_MAX)
-    score_text = f"[{color}]{schema.score}[/{color}]/{SCHEMA_MAX}"
-    lines: list[str] = [f"[bold]Schema.org JSON-LD[/bold] — Score: {score_text}"]
+    parts: list[_Segment] = [*_heading("Schema.org JSON-LD", schema.score, SCHEMA_MAX, color)]
 
     if schema.blocks_found > 0:
-        unique_types = {s.schema_type for s in schema.schemas}
+        unique_types = schema.unique_types
         n_high = sum(1 for t in unique_types if t in HIGH_VALUE_TYPES)
         n_std = len(unique_types) - n_high
         raw = (
@@ -161,30 +262,30 @@ def render_schema_verbose(report: AuditReport | SiteAuditReport) -> Panel:
             + SCHEMA_STANDARD_BONUS * n_std
         )
         capped = min(SCHEMA_MAX, raw)
-        lines.append("")
-        lines.append(
-            f"  [dim]Formula:[/dim] base {SCHEMA_BASE_SCORE}"
+        parts += (
+            "  ",
+            ("Formula:", "dim"),
+            f" base {SCHEMA_BASE_SCORE}"
             f" + {SCHEMA_HIGH_VALUE_BONUS} × {n_high} high-value"
             f" + {SCHEMA_STANDARD_BONUS} × {n_std} standard"
             f" = {raw}"
-            + (f" → capped at {SCHEMA_MAX}" if raw > SCHEMA_MAX else "")
-            + f" = {capped}"
+            f"{f' → capped at {SCHEMA_MAX}' if raw > SCHEMA_MAX else ''}"
+            f" = {capped}\n"
+            f"  Blocks found: {schema.blocks_found}\n",
         )
-        lines.append(f"  Blocks found: {schema.blocks_found}")
-        lines.append("")
-        for s in schema.schemas:
-            props = ", ".join(s.properties) if s.properties else "(no properties)"
-            lines.append(f"  @type: [bold]{s.schema_type}[/bold]")
-            lines.append(f"    Properties: {props}")
+        parts += [
+            segment
+            for s in schema.schemas
+            for segment in (
+                "\n  @type: ",
+                (s.schema_type, "bold"),
+                f"\n    Properties: {', '.join(s.properties) or '(no properties)'}",
+            )
+        ]
     else:
-        lines.append("")
-        lines.append("  [yellow]No JSON-LD structured data found[/yellow]")
+        parts += ("  ", ("No JSON-LD structured data found", "yellow"))
 
-    return Panel(
-        "\n".join(lines),
-        title="Schema.org Detail",
-        border_style=color,
-    )
+    return Panel(Text.assemble(*parts), title="Schema.org Detail", border_style=color)
 
 
 # ── Content Verbose Panel ───────────────────────────────────────────────────
@@ -194,27 +295,11 @@ def render_content_verbose(report: AuditReport | SiteAuditReport) -> Panel:
     """Render detailed content panel with word tier breakdown and bonus formula."""
     content = report.content
     color = _border_color(content.score, CONTENT_MAX)
-    score_text = f"[{color}]{content.score}[/{color}]/{CONTENT_MAX}"
-    lines: list[str] = [f"[bold]Content Density[/bold] — Score: {score_text}"]
-
-    lines.append("")
-    lines.append(f"  Word count: [bold]{content.word_count}[/bold]")
-    lines.append(f"  Char count: {content.char_count}")
 
     # Word tier breakdown — highlight the active tier
-    lines.append("")
-    lines.append("  [dim]Word count tiers:[/dim]")
-    active_tier_score = 0
-    for min_words, tier_score in CONTENT_WORD_TIERS:
-        if content.word_count >= min_words and active_tier_score == 0:
-            lines.append(f"    [green]→ {min_words}+ words = {tier_score} pts (active)[/green]")
-            active_tier_score = tier_score
-        else:
-            lines.append(f"    [dim]  {min_words}+ words = {tier_score} pts[/dim]")
-    if active_tier_score == 0:
-        lines.append("    [red]  < {0} words = 0 pts (below minimum)[/red]".format(
-            CONTENT_WORD_TIERS[-1][0]
-        ))
+    idx = bisect_right(_TIER_THRESHOLDS, content.word_count) - 1
+    active_tier_score = _TIERS_ASCENDING[idx][1] if idx >= 0 else 0
+    tiers = _TIER_SEGMENTS[idx + 1]
 
     # Bonus breakdown
     heading_pts = CONTENT_HEADING_BONUS if content.has_headings else 0
@@ -223,29 +308,31 @@ def render_content_verbose(report: AuditReport | SiteAuditReport) -> Panel:
     raw_total = active_tier_score + heading_pts + list_pts + code_pts
     capped = min(CONTENT_MAX, raw_total)
 
-    lines.append("")
-    lines.append(
-        f"  [dim]Formula:[/dim] {active_tier_score} base"
-        f" + {heading_pts} headings"
-        f" + {list_pts} lists"
-        f" + {code_pts} code"
-        f" = {raw_total}"
-        + (f" → capped at {CONTENT_MAX}" if raw_total > CONTENT_MAX else "")
-        + f" = {capped}/{CONTENT_MAX}"
-    )
-
-    lines.append("")
-    h_status = "[green]Yes[/green]" if content.has_headings else "[red]No[/red]"
-    l_status = "[green]Yes[/green]" if content.has_lists else "[red]No[/red]"
-    c_status = "[green]Yes[/green]" if content.has_code_blocks else "[red]No[/red]"
-    lines.append(
-        f"  Headings: {h_status} (+{CONTENT_HEADING_BONUS})"
-        f"  Lists: {l_status} (+{CONTENT_LIST_BONUS})"
-        f"  Code blocks: {c_status} (+{CONTENT_CODE_BONUS})"
-    )
-
     return Panel(
-        "\n".join(lines),
+        Text.assemble(
+            *_heading("Content Density", content.score, CONTENT_MAX, color),
+            "  Word count: ",
+            (f"{content.word_count}", "bold"),
+            f"\n  Char count: {content.char_count}\n\n  ",
+            ("Word count tiers:", "dim"),
+            *tiers,
+            "\n\n  ",
+            ("Formula:", "dim"),
+            f" {active_tier_score} base"
+            f" + {heading_pts} headings"
+            f" + {list_pts} lists"
+            f" + {code_pts} code"
+            f" = {raw_total}"
+            f"{f' → capped at {CONTENT_MAX}' if raw_total > CONTENT_MAX else ''}"
+            f" = {capped}/{CONTENT_MAX}\n\n"
+            "  Headings: ",
+            _YES_NO_SEGMENT[content.has_headings],
+            f" (+{CONTENT_HEADING_BONUS})  Lists: ",
+            _YES_NO_SEGMENT[content.has_lists],
+            f" (+{CONTENT_LIST_BONUS})  Code blocks: ",
+            _YES_NO_SEGMENT[content.has_code_blocks],
+            f" (+{CONTENT_CODE_BONUS})",
+        ),
         title="Content Detail",
         border_style=color,
     )
@@ -267,41 +354,43 @@ def render_token_analysis_verbose(
         else ("yellow" if lr.context_waste_pct < 70 else "red")
     )
 
-    lines: list[str] = [
-        "[bold]Token Analysis[/bold] [dim](context efficiency metrics)[/dim]",
-        "",
-        f"  Raw HTML tokens:     {lr.raw_tokens:>10,}",
-        f"  Clean MD tokens:     {lr.clean_tokens:>10,}",
-        f"  Context Waste:       [{waste_color}]{lr.context_waste_pct:>9.1f}%[/{waste_color}]",
-    ]
-    if lr.raw_tokens > 0:
-        wasted = lr.raw_tokens - lr.clean_tokens
-        lines[-1] += f"  ({wasted:,} wasted tokens)"
+    # Right-aligned metric columns are laid out by a grid, not width specifiers
+    metrics = Table.grid(padding=(0, 2))
+    metrics.add_column()
+    metrics.add_column(justify="right")
+    metrics.add_column()
+    metrics.add_row("Raw HTML tokens:", f"{lr.raw_tokens:,}")
+    metrics.add_row("Clean MD tokens:", f"{lr.clean_tokens:,}")
+    metrics.add_row(
+        "Context Waste:",
+        Text(f"{lr.context_waste_pct:.1f}%", style=waste_color),
+        f"({lr.raw_tokens - lr.clean_tokens:,} wasted tokens)" if lr.raw_tokens > 0 else "",
+    )
+
+    parts: list[RenderableType] = [_TOKEN_ANALYSIS_HEADING, _BLANK, Padding.indent(metrics, 2)]
 
     if lr.checks:
-        lines.append("")
-        lines.append("  [bold]Lint Checks:[/bold]")
+        checks = Table.grid(padding=(0, 1))
         for check in lr.checks:
             if check.severity == "warn":
-                status = "[yellow]WARN[/yellow]"
-            elif check.passed:
-                status = "[green]PASS[/green]"
+                status = _WARN_SEGMENT
             else:
-                status = "[red]FAIL[/red]"
-            lines.append(f"    {status} {check.name}: {check.detail}")
+                status = _PASS_FAIL_SEGMENT[check.passed]
+            checks.add_row(Text(*status), f"{check.name}: {check.detail}")
+        parts += (_BLANK, _LINT_CHECKS_HEADING, Padding.indent(checks, 4))
 
     if lr.diagnostics:
-        lines.append("")
-        lines.append("  [bold]Diagnostics:[/bold]")
+        diagnostics = Table.grid(padding=(0, 2))
         for d in lr.diagnostics:
             d_color = (
                 "red" if d.severity == "error"
                 else ("yellow" if d.severity == "warn" else "cyan")
             )
-            lines.append(f"    [{d_color}]{d.code}[/{d_color}]  {d.message}")
+            diagnostics.add_row(Text(d.code, style=d_color), d.message)
+        parts += (_BLANK, _DIAGNOSTICS_HEADING, Padding.indent(diagnostics, 4))
 
     return Panel(
-        "\n".join(lines),
+        Group(*parts),
         title="Token Analysis",
         border_style=waste_color,
     )
@@ -316,7 +405,7 @@ def render_rsl_verbose(report: AuditReport | SiteAuditReport) -> Panel | None:
         return None
 
     rsl = report.rsl
-    lines: list[str] = ["[bold]RSL Analysis[/bold] [dim](informational — not scored)[/dim]"]
+    lines: list[str] = [_RSL_HEADING]
 
     if not (rsl.has_crawl_delay or rsl.has_sitemap_directive or rsl.has_ai_specific_rules):
         lines.append("")
@@ -347,21 +436,15 @@ def render_content_usage_verbose(
         return None
 
     cu = report.content_usage
-    lines: list[str] = [
-        "[bold]Content-Usage Header[/bold] [dim](informational — not scored)[/dim]"
-    ]
-
     if not cu.header_found:
-        lines.append("")
-        lines.append("  [dim]Content-Usage header not found[/dim]")
-        return Panel("\n".join(lines), title="Content-Usage Detail", border_style="blue")
+        return _CU_NOT_FOUND_PANEL
 
-    lines.append("")
+    lines: list[str] = [_CU_HEADING, ""]
     lines.append(f"  Header value: [bold]{cu.header_value}[/bold]")
     lines.append("")
 
-    train_icon = "[green]Yes[/green]" if cu.allows_training else "[red]No[/red]"
-    search_icon = "[green]Yes[/green]" if cu.allows_search else "[red]No[/red]"
+    train_icon = _YES_NO[bool(cu.allows_training)]
+    search_icon = _YES_NO[bool(cu.allows_search)]
     lines.append(f"  Training allowed: {train_icon}")
     lines.append(f"  Search allowed: {search_icon}")
 
@@ -374,9 +457,7 @@ def render_eeat_verbose(report: AuditReport | SiteAuditReport) -> Panel | None:
         return None
 
     eeat = report.eeat
-    lines: list[str] = [
-        "[bold]E-E-A-T Signals[/bold] [dim](informational — not scored)[/dim]"
-    ]
+    lines: list[str] = [_EEAT_HEADING]
 
     has_any = (
         eeat.has_author or eeat.has_date or eeat.has_about_page
@@ -394,13 +475,13 @@ def render_eeat_verbose(report: AuditReport | SiteAuditReport) -> Panel | None:
     else:
         lines.append("  Author: [dim]not found[/dim]")
 
-    date_icon = "[green]Yes[/green]" if eeat.has_date else "[red]No[/red]"
+    date_icon = _YES_NO[eeat.has_date]
     lines.append(f"  Publication date: {date_icon}")
 
-    about_icon = "[green]Yes[/green]" if eeat.has_about_page else "[red]No[/red]"
+    about_icon = _YES_NO[eeat.has_about_page]
     lines.append(f"  About page link: {about_icon}")
 
-    contact_icon = "[green]Yes[/green]" if eeat.has_contact_info else "[red]No[/red]"
+    contact_icon = _YES_NO[eeat.has_contact_info]
     lines.append(f"  Contact info: {contact_icon}")
 
     if eeat.has_citations:
@@ -433,30 +514,12 @@ def render_agent_readiness_verbose(
     ]
     lines.append("")
 
-    sub_checks = [
-        ("AGENTS.md", ar.agents_md.score, 5, ar.agents_md.detail),
-        (
-            "Accept: text/markdown",
-            ar.markdown_accept.score,
-            5,
-            ar.markdown_accept.detail,
-        ),
-        ("MCP Endpoint", ar.mcp_endpoint.score, 4, ar.mcp_endpoint.detail),
-        (
-            "Semantic HTML",
-            ar.semantic_html.score,
-            3,
-            ar.semantic_html.detail,
-        ),
-        ("x402 Payment", ar.x402.score, 2, ar.x402.detail),
-        ("NLWeb", ar.nlweb.score, 1, ar.nlweb.detail),
-    ]
-
-    for name, score, max_pts, detail in sub_checks:
-        s_color = "green" if score > 0 else "red"
-        lines.append(f"  [{s_color}]{score}/{max_pts}[/{s_color}]  {name}")
-        if detail:
-            lines.append(f"        [dim]{detail}[/dim]")
+    for attr, name, max_pts in _AGENT_SUB_CHECKS:
+        check = getattr(ar, attr)
+        s_color = "green" if check.score > 0 else "red"
+        lines.append(f"  [{s_color}]{check.score}/{max_pts}[/{s_color}]  {name}")
+        if check.detail:
+            lines.append(f"        [dim]{check.detail}[/dim]")
 
     return Panel(
         "\n".join(lines),
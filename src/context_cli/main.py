@@ -2,33 +2,61 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 import typer
+from typer.core import TyperGroup
+
+# Command name → context_cli.cli module that registers it. Modules are imported
+# only when one of their commands is resolved, so e.g. `context-cli lint` never
+# loads the serve (aiohttp) or benchmark (litellm) stacks. Top-level --help
+# still resolves every command to show its summary.
+_COMMAND_MODULES: dict[str, str] = {
+    "lint": "audit",
+    "benchmark": "benchmark",
+    "compare": "compare",
+    "generate": "generate",
+    "generate-batch": "generate",
+    "history": "history",
+    "leaderboard": "leaderboard",
+    "markdown": "markdown",
+    "mcp": "mcp_cmd",
+    "radar": "radar",
+    "serve": "serve",
+    "watch": "watch",
+}
+
+
+class _LazyCommandGroup(TyperGroup):
+    """Typer group that imports each cli/ module on first use of its commands."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        """Return all command names in registration order without importing them."""
+        return list(_COMMAND_MODULES)
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """Resolve *cmd_name*, registering its module's commands on first access."""
+        if cmd_name not in self.commands and cmd_name in _COMMAND_MODULES:
+            self._load(_COMMAND_MODULES[cmd_name])
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, module_name: str) -> None:
+        module = importlib.import_module(f"context_cli.cli.{module_name}")
+        sub_app = typer.Typer()
+        sub_app.callback()(_noop)  # force a group so multi-command modules fit too
+        module.register(sub_app)
+        group = typer.main.get_command(sub_app)
+        for name, command in group.commands.items():  # type: ignore[attr-defined]
+            self.add_command(command, name)
+
+
+def _noop() -> None:
+    """Placeholder callback for per-module registration apps."""
+
 
 app = typer.Typer(
-    help="Context CLI — LLM Readiness Linter"
+    cls=_LazyCommandGroup,
+    help="Context CLI — LLM Readiness Linter",
 )
-
-# Register commands from cli/ subpackage
-from context_cli.cli import audit as _audit_mod  # noqa: E402
-from context_cli.cli import benchmark as _bench_mod  # noqa: E402
-from context_cli.cli import compare as _compare_mod  # noqa: E402
-from context_cli.cli import generate as _generate_mod  # noqa: E402
-from context_cli.cli import history as _history_mod  # noqa: E402
-from context_cli.cli import leaderboard as _lb_mod  # noqa: E402
-from context_cli.cli import markdown as _markdown_mod  # noqa: E402
-from context_cli.cli import mcp_cmd as _mcp_mod  # noqa: E402
-from context_cli.cli import radar as _radar_mod  # noqa: E402
-from context_cli.cli import serve as _serve_mod  # noqa: E402
-from context_cli.cli import watch as _watch_mod  # noqa: E402
-
-_audit_mod.register(app)
-_bench_mod.register(app)
-_compare_mod.register(app)
-_generate_mod.register(app)
-_history_mod.register(app)
-_lb_mod.register(app)
-_markdown_mod.register(app)
-_mcp_mod.register(app)
-_radar_mod.register(app)
-_serve_mod.register(app)
-_watch_mod.register(app)
+app.callback()(_noop)
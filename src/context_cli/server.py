@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import os
 from typing import Any
 
 from fastmcp import FastMCP
@@ -27,6 +30,45 @@ mcp = FastMCP(
     ),
 )
 
+# One history connection shared by every tool call for the server's lifetime,
+# opened on first use and closed at interpreter exit.
+_history_db: HistoryDB | None = None
+
+
+def _get_history_db() -> HistoryDB:
+    """Return the shared HistoryDB, opening it on first use."""
+    global _history_db
+    if _history_db is None:
+        _history_db = HistoryDB()
+    return _history_db
+
+
+def _close_history_db() -> None:
+    """Close the shared HistoryDB if it was opened."""
+    global _history_db
+    if _history_db is not None:
+        _history_db.close()
+        _history_db = None
+
+
+atexit.register(_close_history_db)
+
+# Optional upper bound on generations in flight across all concurrent
+# generate_batch_tool calls, so parallel MCP requests can share one crawl/LLM
+# budget. Off unless CONTEXT_CLI_MAX_GENERATIONS is set to a positive integer.
+_MAX_GENERATIONS_ENV = "CONTEXT_CLI_MAX_GENERATIONS"
+
+
+def _generation_limit_from_env() -> asyncio.Semaphore | None:
+    """Return the server-wide generation semaphore, or None when unset/invalid."""
+    raw = os.environ.get(_MAX_GENERATIONS_ENV, "").strip()
+    if not raw.isdecimal() or int(raw) < 1:
+        return None
+    return asyncio.Semaphore(int(raw))
+
+
+_generate_limit = _generation_limit_from_env()
+
 
 @mcp.tool
 async def audit(url: str, single_page: bool = False, max_pages: int = 10) -> dict[str, Any]:
@@ -40,7 +82,7 @@ async def audit(url: str, single_page: bool = False, max_pages: int = 10) -> dic
         report = await audit_url(url)
     else:
         report = await audit_site(url, max_pages=max_pages)
-    return report.model_dump()
+    return report.model_dump(mode="json")
 
 
 @mcp.tool
@@ -67,7 +109,7 @@ async def generate(
         output_dir=output_dir,
     )
     result = await generate_assets(config)
-    return result.model_dump()
+    return result.model_dump(mode="json")
 
 
 @mcp.tool
@@ -86,6 +128,10 @@ async def generate_batch_tool(
         model: LLM model to use (auto-detected from env if not set).
         output_dir: Directory to write generated files.
         concurrency: Max concurrent generations (default 3).
+
+    Set the CONTEXT_CLI_MAX_GENERATIONS environment variable on the server to
+    cap generations in flight across all concurrent calls; each call then also
+    waits on that shared limit. Unset, every call runs at its own concurrency.
     """
     from context_cli.core.generate.batch import generate_batch as _generate_batch
     from context_cli.core.models import BatchGenerateConfig
@@ -97,8 +143,8 @@ async def generate_batch_tool(
         output_dir=output_dir,
         concurrency=concurrency,
     )
-    result = await _generate_batch(config)
-    return result.model_dump()
+    result = await _generate_batch(config, shared_limit=_generate_limit)
+    return result.model_dump(mode="json")
 
 
 @mcp.tool
@@ -109,7 +155,7 @@ async def compare(url1: str, url2: str) -> dict[str, Any]:
     per-pillar score deltas.
     """
     report = await compare_urls(url1, url2)
-    return report.model_dump()
+    return report.model_dump(mode="json")
 
 
 @mcp.tool
@@ -119,12 +165,24 @@ async def history(url: str, limit: int = 10) -> list[dict[str, Any]]:
     Returns recent audit entries (newest first), each with timestamp and
     per-pillar scores.
     """
-    db = HistoryDB()
-    try:
-        entries = db.list_entries(url, limit=limit)
-        return [entry.model_dump() for entry in entries]
-    finally:
-        db.close()
+    db = _get_history_db()
+    return [entry.model_dump(mode="json") for entry in db.list_entries(url, limit=limit)]
+
+
+@mcp.tool
+async def history_batch(
+    urls: list[str], limit: int = 10
+) -> dict[str, list[dict[str, Any]]]:
+    """Retrieve audit history for several URLs in a single database query.
+
+    Returns a mapping of each URL to its recent audit entries (newest first),
+    at most ``limit`` per URL.
+    """
+    db = _get_history_db()
+    return {
+        url: [entry.model_dump(mode="json") for entry in entries]
+        for url, entries in db.list_entries_batch(urls, limit=limit).items()
+    }
 
 
 @mcp.tool
@@ -136,7 +194,7 @@ async def recommend(url: str) -> list[dict[str, Any]]:
     """
     report = await audit_url(url)
     recs = generate_recommendations(report)
-    return [rec.model_dump() for rec in recs]
+    return [rec.model_dump(mode="json") for rec in recs]
 
 
 @mcp.tool
@@ -166,7 +224,7 @@ async def radar(
     )
     results = await query_models(config)
     report = build_radar_report(config, results)
-    return report.model_dump()
+    return report.model_dump(mode="json")
 
 
 @mcp.tool
@@ -202,7 +260,7 @@ async def benchmark_tool(
     results = await dispatch_queries(config)
     judged = await judge_all(results, config.brand, config.competitors)
     report = compute_report(config, judged)
-    return report.model_dump()
+    return report.model_dump(mode="json")
 
 
 @mcp.tool
@@ -216,7 +274,7 @@ async def retail_audit_tool(url: str) -> dict[str, Any]:
     from context_cli.core.retail.auditor import retail_audit
 
     report = await retail_audit(url)
-    return report.model_dump()
+    return report.model_dump(mode="json")
 
 
 @mcp.tool
@@ -232,7 +290,7 @@ async def agent_readiness_audit(url: str) -> dict[str, Any]:
     """
     report = await audit_url(url)
     if report.agent_readiness is not None:
-        return report.agent_readiness.model_dump()
+        return report.agent_readiness.model_dump(mode="json")
     return {"error": "Agent readiness data not available"}
 
 
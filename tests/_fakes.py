@@ -0,0 +1,37 @@
+"""Shared litellm fakes for the benchmark dispatcher and judge tests."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from types import ModuleType, SimpleNamespace
+from typing import Any
+
+
+def completion_response(content: str) -> SimpleNamespace:
+    """Build a fake litellm acompletion response with the given message content."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeAcompletion:
+    """Stand-in for litellm.acompletion that records the kwargs of each call.
+
+    Returns *return_value*, or raises *side_effect* when it is set. Tests that
+    need per-call logic patch litellm.acompletion with a plain coroutine instead.
+    """
+
+    def __init__(self, return_value: Any = None) -> None:
+        self.return_value = return_value
+        self.side_effect: BaseException | None = None
+        self.calls: list[dict[str, Any]] = []
+
+    async def __call__(self, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+class LitellmStub(ModuleType):
+    """Stand-in for the litellm package; the code under test only calls acompletion."""
+
+    acompletion: Callable[..., Awaitable[Any]]
@@ -0,0 +1,32 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+import pytest
+
+from tests._fakes import FakeAcompletion, LitellmStub, completion_response
+
+
+@pytest.fixture
+def litellm_module(monkeypatch: pytest.MonkeyPatch) -> LitellmStub:
+    """Put a LitellmStub in sys.modules so tests never import the real litellm."""
+    module = LitellmStub("litellm")
+    monkeypatch.setitem(sys.modules, "litellm", module)
+    return module
+
+
+@pytest.fixture
+def acompletion_response() -> Any:
+    """Default reply of the ``acompletion`` fixture; override per test module."""
+    return completion_response("Response")
+
+
+@pytest.fixture
+def acompletion(litellm_module: LitellmStub, acompletion_response: Any) -> FakeAcompletion:
+    """Install a FakeAcompletion as litellm.acompletion for the duration of a test."""
+    fake = FakeAcompletion(acompletion_response)
+    litellm_module.acompletion = fake
+    return fake
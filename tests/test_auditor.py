@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from unittest.mock import AsyncMock
 
 import httpx
@@ -23,56 +24,47 @@ from context_cli.core.scoring import compute_scores
 # -- check_schema_org ----------------------------------------------------------
 
 
-def test_check_schema_org_with_jsonld():
-    """HTML containing a JSON-LD script should yield one parsed block."""
-    html = """
-    <html><head>
-    <script type="application/ld+json">
-    {"@context": "https://schema.org", "@type": "Organization", "name": "Acme", "url": "https://acme.com"}
-    </script>
-    </head><body></body></html>
-    """
+_JSONLD_HTML = """
+<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "Organization", "name": "Acme", "url": "https://acme.com"}
+</script>
+</head><body></body></html>
+"""
+
+_MULTI_JSONLD_HTML = """
+<html><head>
+<script type="application/ld+json">
+{"@type": "Organization", "name": "Acme"}
+</script>
+<script type="application/ld+json">
+{"@type": "Article", "headline": "Test"}
+</script>
+</head><body></body></html>
+"""
+
+
+@pytest.mark.parametrize(
+    ("html", "expected_props", "expected_detail"),
+    [
+        (_JSONLD_HTML, {"Organization": {"name", "url"}}, "1 JSON-LD block(s) found"),
+        ("", {}, "No HTML to analyze"),
+        ("<html><head></head><body><p>Hello</p></body></html>", {}, "No JSON-LD found"),
+        (
+            _MULTI_JSONLD_HTML,
+            {"Organization": {"name"}, "Article": {"headline"}},
+            "2 JSON-LD block(s) found",
+        ),
+    ],
+    ids=["with_jsonld", "empty_html", "no_jsonld", "multiple_blocks"],
+)
+def test_check_schema_org(html, expected_props, expected_detail):
+    """Each JSON-LD block is parsed into its @type and top-level properties."""
     report = check_schema_org(html)
 
-    assert report.blocks_found == 1
-    assert len(report.schemas) == 1
-    assert report.schemas[0].schema_type == "Organization"
-    assert "name" in report.schemas[0].properties
-    assert "url" in report.schemas[0].properties
-
-
-def test_check_schema_org_empty_html():
-    """Empty HTML should return 0 blocks."""
-    report = check_schema_org("")
-    assert report.blocks_found == 0
-    assert report.schemas == []
-    assert report.detail == "No HTML to analyze"
-
-
-def test_check_schema_org_no_jsonld():
-    """HTML without JSON-LD scripts should return 0 blocks."""
-    html = "<html><head></head><body><p>Hello</p></body></html>"
-    report = check_schema_org(html)
-    assert report.blocks_found == 0
-    assert report.schemas == []
-
-
-def test_check_schema_org_multiple_blocks():
-    """HTML with two JSON-LD scripts should return 2 blocks."""
-    html = """
-    <html><head>
-    <script type="application/ld+json">
-    {"@type": "Organization", "name": "Acme"}
-    </script>
-    <script type="application/ld+json">
-    {"@type": "Article", "headline": "Test"}
-    </script>
-    </head><body></body></html>
-    """
-    report = check_schema_org(html)
-    assert report.blocks_found == 2
-    types = {s.schema_type for s in report.schemas}
-    assert types == {"Organization", "Article"}
+    assert report.blocks_found == len(expected_props)
+    assert {s.schema_type: set(s.properties) for s in report.schemas} == expected_props
+    assert report.detail == expected_detail
 
 
 # -- check_content -------------------------------------------------------------
@@ -111,98 +103,89 @@ def test_check_content_with_code_blocks():
 # -- compute_scores ------------------------------------------------------------
 
 
-def test_compute_scores_full_marks():
-    """All bots allowed + llms.txt + 2 schemas + 1500 words + headings + lists -> high score."""
-    bots = [BotAccessResult(bot=name, allowed=True, detail="Allowed") for name in [
-        "GPTBot", "ChatGPT-User", "Google-Extended", "ClaudeBot",
-        "PerplexityBot", "Amazonbot", "OAI-SearchBot",
-    ]]
-    robots = RobotsReport(found=True, bots=bots)
-    llms_txt = LlmsTxtReport(found=True, url="https://example.com/llms.txt")
-    schema_org = SchemaReport(
-        blocks_found=2,
-        schemas=[
-            SchemaOrgResult(schema_type="Organization", properties=["name"]),
-            SchemaOrgResult(schema_type="Article", properties=["headline"]),
-        ],
-    )
-    content = ContentReport(
-        word_count=1500,
-        has_headings=True,
-        has_lists=True,
-        has_code_blocks=False,
-    )
-
-    robots, llms_txt, schema_org, content, overall = compute_scores(
-        robots, llms_txt, schema_org, content
-    )
-
-    # Robots: 25 (all 7 bots allowed)
-    assert robots.score == 25
-
-    # llms.txt: 10 (revised weight)
-    assert llms_txt.score == 10
-
-    # Schema: 8 base + 5 (Article=high-value) + 3 (Organization=standard) = 16
-    assert schema_org.score == 16
-
-    # Content: 25 (1500+ words) + 7 (headings) + 5 (lists) = 37
-    assert content.score == 37
-
-    # Overall: 25 + 10 + 16 + 37 = 88
-    assert overall == 88
-
-
-def test_compute_scores_nothing_found():
-    """No robots, no llms.txt, no schema, no content -> score 0."""
-    robots = RobotsReport(found=False)
-    llms_txt = LlmsTxtReport(found=False)
-    schema_org = SchemaReport()
-    content = ContentReport()
+_ALL_BOTS = (
+    "GPTBot", "ChatGPT-User", "Google-Extended", "ClaudeBot",
+    "PerplexityBot", "Amazonbot", "OAI-SearchBot",
+)
 
-    _, _, _, _, overall = compute_scores(robots, llms_txt, schema_org, content)
-    assert overall == 0
+# BotAccessResult is frozen, so these can be shared across cases.
+_ALL_BOTS_ALLOWED = tuple(
+    BotAccessResult(bot=name, allowed=True, detail="Allowed") for name in _ALL_BOTS
+)
+_THREE_BOTS_ALLOWED = (
+    BotAccessResult(bot="GPTBot", allowed=True, detail="Allowed"),
+    BotAccessResult(bot="ClaudeBot", allowed=True, detail="Allowed"),
+    BotAccessResult(bot="PerplexityBot", allowed=True, detail="Allowed"),
+    BotAccessResult(bot="Amazonbot", allowed=False, detail="Blocked"),
+    BotAccessResult(bot="OAI-SearchBot", allowed=False, detail="Blocked"),
+    BotAccessResult(bot="ChatGPT-User", allowed=False, detail="Blocked"),
+    BotAccessResult(bot="Google-Extended", allowed=False, detail="Blocked"),
+)
 
 
-def test_compute_scores_partial():
-    """Partial results should yield proportional scores."""
-    # 3 of 7 bots allowed
-    bots = [
-        BotAccessResult(bot="GPTBot", allowed=True, detail="Allowed"),
-        BotAccessResult(bot="ClaudeBot", allowed=True, detail="Allowed"),
-        BotAccessResult(bot="PerplexityBot", allowed=True, detail="Allowed"),
-        BotAccessResult(bot="Amazonbot", allowed=False, detail="Blocked"),
-        BotAccessResult(bot="OAI-SearchBot", allowed=False, detail="Blocked"),
-        BotAccessResult(bot="ChatGPT-User", allowed=False, detail="Blocked"),
-        BotAccessResult(bot="Google-Extended", allowed=False, detail="Blocked"),
-    ]
-    robots = RobotsReport(found=True, bots=bots)
-    llms_txt = LlmsTxtReport(found=False)
+@pytest.mark.parametrize(
+    ("bots", "llms_found", "schema_types", "content_kwargs", "expected"),
+    [
+        # Robots 25 (7/7) + llms.txt 10 + schema 8 base + 5 (Article=high-value)
+        # + 3 (Organization=standard) + content 25 (1500+ words) + 7 + 5 = 88
+        (
+            _ALL_BOTS_ALLOWED,
+            True,
+            ("Organization", "Article"),
+            {"word_count": 1500, "has_headings": True, "has_lists": True},
+            (25, 10, 16, 37, 88),
+        ),
+        # Nothing found anywhere -> every pillar scores 0
+        (None, False, (), {}, (0, 0, 0, 0, 0)),
+        # Robots round(25 * 3/7, 1) = 10.7 + schema 8 + 3 (WebSite=standard)
+        # + content 15 (400+ words) + 7 + 5 = 48.7
+        (
+            _THREE_BOTS_ALLOWED,
+            False,
+            ("WebSite",),
+            {"word_count": 500, "has_headings": True, "has_lists": True},
+            (10.7, 0, 11, 27, 10.7 + 0 + 11 + 27),
+        ),
+    ],
+    ids=["full_marks", "nothing_found", "partial"],
+)
+def test_compute_scores(bots, llms_found, schema_types, content_kwargs, expected):
+    """Pillar scores and the overall total follow the V2 weights."""
+    # compute_scores writes scores onto its inputs, so build fresh reports per case.
+    if bots is None:
+        robots = RobotsReport(found=False)
+    else:
+        robots = RobotsReport(found=True, bots=list(bots))
+    llms_txt = LlmsTxtReport(
+        found=llms_found, url="https://example.com/llms.txt" if llms_found else None
+    )
     schema_org = SchemaReport(
-        blocks_found=1,
-        schemas=[SchemaOrgResult(schema_type="WebSite", properties=["name"])],
+        blocks_found=len(schema_types),
+        schemas=[SchemaOrgResult(schema_type=t, properties=["name"]) for t in schema_types],
     )
-    content = ContentReport(word_count=500, has_headings=True, has_lists=True)
+    content = ContentReport(**content_kwargs)
 
     robots, llms_txt, schema_org, content, overall = compute_scores(
         robots, llms_txt, schema_org, content
     )
 
-    # Robots: round(25 * 3/7, 1) = 10.7
-    assert robots.score == 10.7
-    assert llms_txt.score == 0
-    # Schema: 8 + 3 (WebSite=standard) = 11
-    assert schema_org.score == 11
-    # Content: 15 (400+ words) + 7 (headings) + 5 (lists) = 27
-    assert content.score == 27
-    assert overall == 10.7 + 0 + 11 + 27
+    assert (robots.score, llms_txt.score, schema_org.score, content.score, overall) == expected
 
 
 # -- check_robots (async, mocked HTTP) ----------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_check_robots_returns_tuple():
+@pytest.fixture
+def client_mock_factory() -> Callable[[], AsyncMock]:
+    """Return a factory for fresh spec'd httpx.AsyncClient mocks."""
+
+    def make() -> AsyncMock:
+        return AsyncMock(spec=httpx.AsyncClient)
+
+    return make
+
+
+async def test_check_robots_returns_tuple(client_mock_factory):
     """check_robots should return (RobotsReport, raw_robots_text | None)."""
     robots_txt = "User-agent: *\nAllow: /\n\nUser-agent: GPTBot\nDisallow: /private\n"
 
@@ -210,7 +193,7 @@ async def test_check_robots_returns_tuple():
     mock_response.status_code = 200
     mock_response.text = robots_txt
 
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client = client_mock_factory()
     mock_client.get = AsyncMock(return_value=mock_response)
 
     report, raw_text = await check_robots("https://example.com/page", mock_client)
@@ -221,13 +204,12 @@ async def test_check_robots_returns_tuple():
     assert raw_text == robots_txt
 
 
-@pytest.mark.asyncio
-async def test_check_robots_not_found():
+async def test_check_robots_not_found(client_mock_factory):
     """check_robots should handle missing robots.txt gracefully."""
     mock_response = AsyncMock()
     mock_response.status_code = 404
 
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client = client_mock_factory()
     mock_client.get = AsyncMock(return_value=mock_response)
 
     report, raw_text = await check_robots("https://example.com", mock_client)
@@ -237,10 +219,9 @@ async def test_check_robots_not_found():
     assert raw_text is None
 
 
-@pytest.mark.asyncio
-async def test_check_robots_http_error():
+async def test_check_robots_http_error(client_mock_factory):
     """check_robots should handle HTTP errors without raising."""
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client = client_mock_factory()
     mock_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
 
     report, raw_text = await check_robots("https://example.com", mock_client)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import io
 import json
-from unittest.mock import patch
+from types import SimpleNamespace
 
 import pytest
 from typer.testing import CliRunner
 
+from context_cli.core import batch
 from context_cli.core.batch import parse_url_file, run_batch_audit
 from context_cli.core.models import (
     AuditReport,
@@ -52,6 +54,12 @@ def _site_report(url: str = "https://example.com", score: float = 68.0) -> SiteA
     )
 
 
+# Built once; fake audits hand out model_copy() clones with only the URL changed,
+# which skips re-validating the nested pillar reports.
+_CANON_REPORT = _report()
+_CANON_SITE = _site_report()
+
+
 # ── BatchAuditReport model ──────────────────────────────────────────────────
 
 
@@ -77,52 +85,75 @@ def test_batch_audit_report_defaults():
 # ── parse_url_file ───────────────────────────────────────────────────────────
 
 
-def test_parse_url_file_txt(tmp_path):
-    """Read URLs from a .txt file, one per line."""
-    f = tmp_path / "urls.txt"
-    f.write_text("https://a.com\nhttps://b.com\nhttps://c.com\n")
-    urls = parse_url_file(str(f))
-    assert urls == ["https://a.com", "https://b.com", "https://c.com"]
-
-
-def test_parse_url_file_skip_comments(tmp_path):
-    """Lines starting with # should be skipped."""
-    f = tmp_path / "urls.txt"
-    f.write_text("# This is a comment\nhttps://a.com\n# Another comment\nhttps://b.com\n")
-    urls = parse_url_file(str(f))
-    assert urls == ["https://a.com", "https://b.com"]
-
-
-def test_parse_url_file_skip_empty_lines(tmp_path):
-    """Empty lines and whitespace-only lines should be skipped."""
-    f = tmp_path / "urls.txt"
-    f.write_text("https://a.com\n\n   \nhttps://b.com\n\n")
-    urls = parse_url_file(str(f))
-    assert urls == ["https://a.com", "https://b.com"]
-
-
-def test_parse_url_file_csv(tmp_path):
-    """For .csv files, use the first column as URL."""
-    f = tmp_path / "urls.csv"
-    f.write_text("url,name\nhttps://a.com,Site A\nhttps://b.com,Site B\n")
-    urls = parse_url_file(str(f))
-    assert urls == ["https://a.com", "https://b.com"]
+@pytest.mark.parametrize(
+    ("fname", "content", "expected"),
+    [
+        pytest.param(
+            "urls.txt",
+            "https://a.com\nhttps://b.com\nhttps://c.com\n",
+            ["https://a.com", "https://b.com", "https://c.com"],
+            id="txt",
+        ),
+        # Lines starting with # are skipped
+        pytest.param(
+            "urls.txt",
+            "# This is a comment\nhttps://a.com\n# Another comment\nhttps://b.com\n",
+            ["https://a.com", "https://b.com"],
+            id="skip_comments",
+        ),
+        # Empty and whitespace-only lines are skipped
+        pytest.param(
+            "urls.txt",
+            "https://a.com\n\n   \nhttps://b.com\n\n",
+            ["https://a.com", "https://b.com"],
+            id="skip_empty_lines",
+        ),
+        # URLs without a scheme get https:// prepended
+        pytest.param(
+            "urls.txt",
+            "example.com\nhttps://already.com\n",
+            ["https://example.com", "https://already.com"],
+            id="auto_https",
+        ),
+        # .csv files use the first column and skip a header row
+        pytest.param(
+            "urls.csv",
+            "url,name\nhttps://a.com,Site A\nhttps://b.com,Site B\n",
+            ["https://a.com", "https://b.com"],
+            id="csv",
+        ),
+        pytest.param(
+            "urls.csv",
+            "# comment\nhttps://a.com,Site A\n",
+            ["https://a.com"],
+            id="csv_comments",
+        ),
+        pytest.param(
+            "urls.csv",
+            "https://a.com,Site A\n\nhttps://b.com,Site B\n",
+            ["https://a.com", "https://b.com"],
+            id="csv_empty_rows",
+        ),
+    ],
+)
+def test_parse_url_file(fname, content, expected):
+    """Read URLs from .txt (one per line) and .csv (first column) sources."""
+    source = io.StringIO(content)
+    source.name = fname  # type: ignore[misc]
+    assert parse_url_file(source) == expected
 
 
-def test_parse_url_file_csv_comments(tmp_path):
-    """CSV files should also skip # comment lines."""
+def test_parse_url_file_from_path(tmp_path):
+    """Paths (str or PathLike) are opened and dispatched on their suffix."""
     f = tmp_path / "urls.csv"
-    f.write_text("# comment\nhttps://a.com,Site A\n")
-    urls = parse_url_file(str(f))
-    assert urls == ["https://a.com"]
+    f.write_text("url,name\nexample.com,Example\n")
+    assert parse_url_file(f) == ["https://example.com"]
+    assert parse_url_file(str(f)) == ["https://example.com"]
 
 
-def test_parse_url_file_csv_empty_rows(tmp_path):
-    """CSV files with empty rows should skip them gracefully."""
-    f = tmp_path / "urls.csv"
-    f.write_text("https://a.com,Site A\n\nhttps://b.com,Site B\n")
-    urls = parse_url_file(str(f))
-    assert urls == ["https://a.com", "https://b.com"]
+def test_parse_url_file_unnamed_stream():
+    """A stream without a name is parsed as plain text."""
+    assert parse_url_file(io.StringIO("a.com,b.com\n")) == ["https://a.com,b.com"]
 
 
 def test_parse_url_file_not_found():
@@ -131,27 +162,18 @@ def test_parse_url_file_not_found():
         parse_url_file("/nonexistent/file.txt")
 
 
-def test_parse_url_file_auto_https(tmp_path):
-    """URLs without scheme should get https:// prepended."""
-    f = tmp_path / "urls.txt"
-    f.write_text("example.com\nhttps://already.com\n")
-    urls = parse_url_file(str(f))
-    assert urls == ["https://example.com", "https://already.com"]
-
-
 # ── run_batch_audit ──────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_run_batch_audit_single_mode():
+async def test_run_batch_audit_single_mode(monkeypatch):
     """Batch audit in single mode calls audit_url for each URL."""
     async def _fake(url, **kwargs):
-        return _report(url)
+        return _CANON_REPORT.model_copy(update={"url": url})
 
-    with patch("context_cli.core.batch.audit_url", side_effect=_fake):
-        result = await run_batch_audit(
-            ["https://a.com", "https://b.com"], single=True
-        )
+    monkeypatch.setattr(batch, "audit_url", _fake)
+    result = await run_batch_audit(
+        ["https://a.com", "https://b.com"], single=True
+    )
 
     assert len(result.reports) == 2
     assert result.reports[0].url == "https://a.com"
@@ -159,23 +181,21 @@ async def test_run_batch_audit_single_mode():
     assert result.errors == {}
 
 
-@pytest.mark.asyncio
-async def test_run_batch_audit_site_mode():
+async def test_run_batch_audit_site_mode(monkeypatch):
     """Batch audit in site mode calls audit_site for each URL."""
     async def _fake(url, **kwargs):
-        return _site_report(url)
+        return _CANON_SITE.model_copy(update={"url": url, "domain": url.replace("https://", "")})
 
-    with patch("context_cli.core.batch.audit_site", side_effect=_fake):
-        result = await run_batch_audit(
-            ["https://a.com", "https://b.com"], single=False
-        )
+    monkeypatch.setattr(batch, "audit_site", _fake)
+    result = await run_batch_audit(
+        ["https://a.com", "https://b.com"], single=False
+    )
 
     assert len(result.reports) == 2
     assert result.errors == {}
 
 
-@pytest.mark.asyncio
-async def test_run_batch_audit_error_handling():
+async def test_run_batch_audit_error_handling(monkeypatch):
     """URLs that fail should be captured in errors, not crash the batch."""
     call_count = 0
 
@@ -184,12 +204,12 @@ async def test_run_batch_audit_error_handling():
         call_count += 1
         if "bad" in url:
             raise RuntimeError("Connection refused")
-        return _report(url)
+        return _CANON_REPORT.model_copy(update={"url": url})
 
-    with patch("context_cli.core.batch.audit_url", side_effect=_fake):
-        result = await run_batch_audit(
-            ["https://good.com", "https://bad.com"], single=True
-        )
+    monkeypatch.setattr(batch, "audit_url", _fake)
+    result = await run_batch_audit(
+        ["https://good.com", "https://bad.com"], single=True
+    )
 
     assert len(result.reports) == 1
     assert result.reports[0].url == "https://good.com"
@@ -197,74 +217,76 @@ async def test_run_batch_audit_error_handling():
     assert "Connection refused" in result.errors["https://bad.com"]
 
 
-@pytest.mark.asyncio
-async def test_run_batch_audit_concurrency():
+async def test_run_batch_audit_concurrency(monkeypatch):
     """Concurrency should limit parallel execution."""
     import asyncio
 
     active = 0
     max_active = 0
+    # Released once the first two audits are in flight together.
+    gate = asyncio.Event()
 
     async def _fake(url, **kwargs):
         nonlocal active, max_active
         active += 1
         max_active = max(max_active, active)
-        await asyncio.sleep(0.05)
+        if active == 2:
+            gate.set()
+        await asyncio.wait_for(gate.wait(), timeout=1)
+        # Yield once so any audit not held back by the semaphore would start now.
+        await asyncio.sleep(0)
         active -= 1
-        return _report(url)
+        return _CANON_REPORT.model_copy(update={"url": url})
 
     urls = [f"https://site{i}.com" for i in range(6)]
-    with patch("context_cli.core.batch.audit_url", side_effect=_fake):
-        result = await run_batch_audit(urls, single=True, concurrency=2)
+    monkeypatch.setattr(batch, "audit_url", _fake)
+    result = await run_batch_audit(urls, single=True, concurrency=2)
 
     assert len(result.reports) == 6
-    assert max_active <= 2
+    assert max_active == 2
 
 
-@pytest.mark.asyncio
-async def test_run_batch_audit_passes_timeout():
+async def test_run_batch_audit_passes_timeout(monkeypatch):
     """Batch audit should pass timeout through to audit functions."""
     captured_kwargs: list[dict] = []
 
     async def _fake(url, **kwargs):
         captured_kwargs.append(kwargs)
-        return _report(url)
+        return _CANON_REPORT.model_copy(update={"url": url})
 
-    with patch("context_cli.core.batch.audit_url", side_effect=_fake):
-        await run_batch_audit(["https://a.com"], single=True, timeout=45)
+    monkeypatch.setattr(batch, "audit_url", _fake)
+    await run_batch_audit(["https://a.com"], single=True, timeout=45)
 
     assert captured_kwargs[0]["timeout"] == 45
 
 
-@pytest.mark.asyncio
-async def test_run_batch_audit_passes_max_pages():
+async def test_run_batch_audit_passes_max_pages(monkeypatch):
     """Batch audit in site mode should pass max_pages through."""
     captured_kwargs: list[dict] = []
 
     async def _fake(url, **kwargs):
         captured_kwargs.append(kwargs)
-        return _site_report(url)
+        return _CANON_SITE.model_copy(update={"url": url, "domain": url.replace("https://", "")})
 
-    with patch("context_cli.core.batch.audit_site", side_effect=_fake):
-        await run_batch_audit(["https://a.com"], single=False, max_pages=5)
+    monkeypatch.setattr(batch, "audit_site", _fake)
+    await run_batch_audit(["https://a.com"], single=False, max_pages=5)
 
     assert captured_kwargs[0]["max_pages"] == 5
 
 
-@pytest.mark.asyncio
-async def test_run_batch_audit_progress_callback():
+async def test_run_batch_audit_progress_callback(monkeypatch):
     """Progress callback should be called for each URL."""
     msgs: list[str] = []
 
     async def _fake(url, **kwargs):
-        return _report(url)
+        return _CANON_REPORT.model_copy(update={"url": url})
 
-    with patch("context_cli.core.batch.audit_url", side_effect=_fake):
-        await run_batch_audit(
-            ["https://a.com", "https://b.com"],
-            single=True,
-            progress_callback=msgs.append,
-        )
+    monkeypatch.setattr(batch, "audit_url", _fake)
+    await run_batch_audit(
+        ["https://a.com", "https://b.com"],
+        single=True,
+        progress_callback=msgs.append,
+    )
 
     assert len(msgs) >= 2
 
@@ -272,84 +294,72 @@ async def test_run_batch_audit_progress_callback():
 # ── CLI --file flag integration ──────────────────────────────────────────────
 
 
-def test_cli_file_flag_json(tmp_path):
-    """--file with --json should output BatchAuditReport JSON."""
-    url_file = tmp_path / "urls.txt"
-    url_file.write_text("https://a.com\nhttps://b.com\n")
-
-    async def _fake(urls, **kwargs):
-        return BatchAuditReport(
-            urls=urls,
-            reports=[_report("https://a.com"), _report("https://b.com")],
-        )
+@pytest.fixture(scope="module")
+def url_file(tmp_path_factory):
+    """One URL file shared by every CLI test that stubs out run_batch_audit."""
+    path = tmp_path_factory.mktemp("batch") / "urls.txt"
+    path.write_text("https://a.com\nhttps://b.com\n")
+    return path
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
-        result = runner.invoke(
-            app, ["lint", "--file", str(url_file), "--json"]
-        )
 
-    assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert "urls" in data
-    assert len(data["reports"]) == 2
-
-
-def test_cli_file_flag_rich(tmp_path):
-    """--file should render a Rich summary table."""
-    url_file = tmp_path / "urls.txt"
-    url_file.write_text("https://a.com\n")
+@pytest.fixture
+def batch_stub(monkeypatch):
+    """Stub run_batch_audit; tests set ``reports``/``errors`` and read ``calls``."""
+    stub = SimpleNamespace(calls=[], reports=[_report("https://a.com")], errors={})
 
     async def _fake(urls, **kwargs):
-        return BatchAuditReport(
-            urls=urls,
-            reports=[_report("https://a.com", score=55.0)],
-        )
+        stub.calls.append(kwargs)
+        return BatchAuditReport(urls=urls, reports=stub.reports, errors=stub.errors)
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
-        result = runner.invoke(app, ["lint", "--file", str(url_file)])
-
-    assert result.exit_code == 0
-    assert "a.com" in result.output
-    assert "55.0" in result.output
+    monkeypatch.setattr(batch, "run_batch_audit", _fake)
+    return stub
 
 
-def test_cli_file_flag_with_errors(tmp_path):
-    """Batch errors should be displayed in Rich output."""
-    url_file = tmp_path / "urls.txt"
-    url_file.write_text("https://a.com\nhttps://bad.com\n")
-
-    async def _fake(urls, **kwargs):
-        return BatchAuditReport(
-            urls=urls,
-            reports=[_report("https://a.com")],
-            errors={"https://bad.com": "Connection refused"},
-        )
+def test_cli_file_flag_json(url_file, batch_stub):
+    """--file with --json should output BatchAuditReport JSON."""
+    batch_stub.reports = [_report("https://a.com"), _report("https://b.com")]
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
-        result = runner.invoke(app, ["lint", "--file", str(url_file)])
+    result = runner.invoke(app, ["lint", "--file", str(url_file), "--json"])
 
     assert result.exit_code == 0
-    assert "bad.com" in result.output
-    assert "Connection refused" in result.output
+    data = json.loads(result.output)
+    assert data["urls"] == ["https://a.com", "https://b.com"]
+    assert len(data["reports"]) == 2
 
 
-def test_cli_concurrency_flag(tmp_path):
-    """--concurrency should be passed through to run_batch_audit."""
-    url_file = tmp_path / "urls.txt"
-    url_file.write_text("https://a.com\n")
-    captured: list[dict] = []
-
-    async def _fake(urls, **kwargs):
-        captured.append(kwargs)
-        return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
+@pytest.mark.parametrize(
+    ("extra_args", "errors", "expected_output", "expected_kwargs"),
+    [
+        # Rich summary table
+        pytest.param([], {}, ["a.com", "55.0"], {}, id="rich"),
+        # Batch errors are listed in the Rich output
+        pytest.param(
+            [], {"https://bad.com": "Connection refused"},
+            ["bad.com", "Connection refused"], {},
+            id="rich_with_errors",
+        ),
+        pytest.param(["--format", "csv"], {}, ["url", "a.com"], {}, id="csv"),
+        pytest.param(["--format", "markdown"], {}, ["a.com"], {}, id="markdown"),
+        # Flags are forwarded to run_batch_audit
+        pytest.param(
+            ["--concurrency", "5", "--json"], {}, [], {"concurrency": 5}, id="concurrency"
+        ),
+        pytest.param(["--single", "--json"], {}, [], {"single": True}, id="single"),
+        pytest.param(["--timeout", "30", "--json"], {}, [], {"timeout": 30}, id="timeout"),
+    ],
+)
+def test_cli_file_flag(
+    url_file, batch_stub, extra_args, errors, expected_output, expected_kwargs
+):
+    """--file renders each output format and forwards batch options."""
+    batch_stub.errors = errors
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
-        result = runner.invoke(
-            app, ["lint", "--file", str(url_file), "--concurrency", "5", "--json"]
-        )
+    result = runner.invoke(app, ["lint", "--file", str(url_file), *extra_args])
 
     assert result.exit_code == 0
-    assert captured[0]["concurrency"] == 5
+    for text in expected_output:
+        assert text in result.output
+    assert batch_stub.calls[0].items() >= expected_kwargs.items()
 
 
 def test_cli_file_not_found(tmp_path):
@@ -366,79 +376,6 @@ def test_cli_no_url_no_file():
     assert result.exit_code != 0
 
 
-def test_cli_file_flag_csv_format(tmp_path):
-    """--file with --format csv should output CSV."""
-    url_file = tmp_path / "urls.txt"
-    url_file.write_text("https://a.com\n")
-
-    async def _fake(urls, **kwargs):
-        return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
-
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
-        result = runner.invoke(
-            app, ["lint", "--file", str(url_file), "--format", "csv"]
-        )
-
-    assert result.exit_code == 0
-    assert "url" in result.output
-    assert "a.com" in result.output
-
-
-def test_cli_file_flag_markdown_format(tmp_path):
-    """--file with --format markdown should output markdown."""
-    url_file = tmp_path / "urls.txt"
-    url_file.write_text("https://a.com\n")
-
-    async def _fake(urls, **kwargs):
-        return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
-
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
-        result = runner.invoke(
-            app, ["lint", "--file", str(url_file), "--format", "markdown"]
-        )
-
-    assert result.exit_code == 0
-    assert "Context" in result.output or "a.com" in result.output
-
-
-def test_cli_file_flag_passes_single(tmp_path):
-    """--file --single should pass single=True to batch audit."""
-    url_file = tmp_path / "urls.txt"
-    url_file.write_text("https://a.com\n")
-    captured: list[dict] = []
-
-    async def _fake(urls, **kwargs):
-        captured.append(kwargs)
-        return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
-
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
-        result = runner.invoke(
-            app, ["lint", "--file", str(url_file), "--single", "--json"]
-        )
-
-    assert result.exit_code == 0
-    assert captured[0]["single"] is True
-
-
-def test_cli_file_flag_passes_timeout(tmp_path):
-    """--file --timeout should pass timeout to batch audit."""
-    url_file = tmp_path / "urls.txt"
-    url_file.write_text("https://a.com\n")
-    captured: list[dict] = []
-
-    async def _fake(urls, **kwargs):
-        captured.append(kwargs)
-        return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
-
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
-        result = runner.invoke(
-            app, ["lint", "--file", str(url_file), "--timeout", "30", "--json"]
-        )
-
-    assert result.exit_code == 0
-    assert captured[0]["timeout"] == 30
-
-
 def test_cli_file_empty_urls(tmp_path):
     """--file with a file containing only comments/blanks should warn and exit 0."""
     url_file = tmp_path / "urls.txt"
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import json
+import sys
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from typer.testing import CliRunner
 
+from context_cli.cli import benchmark as cli_benchmark
+from context_cli.core.benchmark import dispatcher, judge, loader, metrics
 from context_cli.core.models import (
     BenchmarkConfig,
     BenchmarkReport,
@@ -17,29 +23,37 @@ from context_cli.core.models import (
     PromptEntry,
 )
 from context_cli.main import app
+from context_cli.server import benchmark_tool
 
 runner = CliRunner()
 
+# FastMCP 2.x wraps @mcp.tool functions in FunctionTool; access via .fn
+_bench_fn = benchmark_tool.fn if hasattr(benchmark_tool, "fn") else benchmark_tool
+
 
 def _pe(text: str, category: str | None = None) -> PromptEntry:
     """Shorthand to create a PromptEntry."""
-    return PromptEntry(prompt=text, category=category)
+    return PromptEntry.model_construct(prompt=text, category=category)
 
 
 def _make_report(brand: str = "TestBrand") -> BenchmarkReport:
-    """Create a mock benchmark report for testing."""
+    """Create a mock benchmark report for testing.
+
+    Hand-written, known-valid data, so it is built with model_construct()
+    to skip validation.
+    """
     pe = _pe("best brand?", "general")
-    config = BenchmarkConfig(
+    config = BenchmarkConfig.model_construct(
         prompts=[pe],
         brand=brand,
         competitors=["CompA", "CompB"],
         models=["gpt-4o-mini"],
         runs_per_model=3,
     )
-    return BenchmarkReport(
+    return BenchmarkReport.model_construct(
         config=config,
         results=[
-            PromptBenchmarkResult(
+            PromptBenchmarkResult.model_construct(
                 prompt=pe,
                 model="gpt-4o-mini",
                 run_index=0,
@@ -47,7 +61,7 @@ def _make_report(brand: str = "TestBrand") -> BenchmarkReport:
             ),
         ],
         model_summaries=[
-            ModelBenchmarkSummary(
+            ModelBenchmarkSummary.model_construct(
                 model="gpt-4o-mini",
                 mention_rate=0.75,
                 recommendation_rate=0.50,
@@ -62,12 +76,61 @@ def _make_report(brand: str = "TestBrand") -> BenchmarkReport:
 
 
 def _make_prompts() -> list[PromptEntry]:
+    """Prompts returned by the mocked loader."""
     return [
         _pe("best brand?", "general"),
         _pe("top recommendations?", "general"),
     ]
 
 
+def _async_return(value: Any) -> Callable[..., Awaitable[Any]]:
+    async def _stub(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _stub
+
+
+_PROMPTS_FILE = Path(__file__).parent / "fixtures" / "benchmark" / "prompts.txt"
+
+
+@pytest.fixture(scope="module")
+def prompts_file() -> Path:
+    """A checked-in prompts file; load_prompts is mocked, so it only has to exist."""
+    return _PROMPTS_FILE
+
+
+@pytest.fixture(scope="module")
+def mock_report() -> BenchmarkReport:
+    """One BenchmarkReport shared by tests that only render it."""
+    return _make_report()
+
+
+@pytest.fixture
+def mock_pipeline(
+    monkeypatch: pytest.MonkeyPatch, mock_report: BenchmarkReport
+) -> SimpleNamespace:
+    """Swap the benchmark pipeline for mocks that succeed with ``mock_report``.
+
+    Covers the CLI entry points (``load_prompts``/``_run_benchmark``) and the
+    core stages the MCP tool awaits directly. Tests override attributes on the
+    returned mocks (``return_value``/``side_effect``) to exercise failures.
+    The awaited stages are never asserted on, so they are plain async stubs.
+    """
+    ns = SimpleNamespace(
+        load=MagicMock(return_value=_make_prompts()),
+        run=MagicMock(return_value=mock_report),
+        dispatch=_async_return(["response1"]),
+        judge=_async_return([]),
+        compute=MagicMock(return_value=mock_report),
+    )
+    monkeypatch.setattr(loader, "load_prompts", ns.load)
+    monkeypatch.setattr(cli_benchmark, "_run_benchmark", ns.run)
+    monkeypatch.setattr(dispatcher, "dispatch_queries", ns.dispatch)
+    monkeypatch.setattr(judge, "judge_all", ns.judge)
+    monkeypatch.setattr(metrics, "compute_report", ns.compute)
+    return ns
+
+
 class TestBenchmarkCLIRegistration:
     """Verify the benchmark command is registered on the Typer app."""
 
@@ -86,12 +149,13 @@ class TestBenchmarkCLIPromptFileValidation:
         result = runner.invoke(
             app,
             ["benchmark", str(tmp_path / "nonexistent.txt"), "-b", "Brand"],
+            catch_exceptions=False,
         )
         assert result.exit_code != 0
 
-    @patch("context_cli.core.benchmark.loader.load_prompts", return_value=[])
-    def test_empty_prompts_file(self, mock_load: MagicMock, tmp_path: Path) -> None:
+    def test_empty_prompts_file(self, mock_pipeline: SimpleNamespace, tmp_path: Path) -> None:
         """Should fail if prompts file contains no prompts after loading."""
+        mock_pipeline.load.return_value = []
         f = tmp_path / "empty.txt"
         f.write_text("")
         result = runner.invoke(app, ["benchmark", str(f), "-b", "Brand", "-y"])
@@ -102,306 +166,172 @@ class TestBenchmarkCLIPromptFileValidation:
 class TestBenchmarkCLIFlow:
     """Tests for the full benchmark CLI flow (with mocked core functions)."""
 
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
-    def test_basic_run_rich_output(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
-        """Should display Rich output on success."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?\ntop recommendations?")
-        mock_load.return_value = _make_prompts()
-        mock_run.return_value = _make_report()
-
-        result = runner.invoke(
-            app,
-            ["benchmark", str(f), "-b", "TestBrand", "-y"],
-        )
-        assert result.exit_code == 0
-        assert "TestBrand" in result.output
-        assert "75" in result.output or "0.75" in result.output
-
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
-    def test_json_output(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
-        """Should output valid JSON when --json is passed."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
-        mock_run.return_value = _make_report()
-
-        result = runner.invoke(
-            app,
-            ["benchmark", str(f), "-b", "TestBrand", "-y", "--json"],
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert data["config"]["brand"] == "TestBrand"
-        assert "overall_mention_rate" in data
-
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
-    def test_competitor_flags(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
-        """Should pass competitors through to the benchmark."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
-        mock_run.return_value = _make_report()
-
-        result = runner.invoke(
-            app,
-            [
-                "benchmark",
-                str(f),
-                "-b",
-                "TestBrand",
-                "-c",
-                "CompA",
-                "-c",
-                "CompB",
-                "-y",
-                "--json",
-            ],
-        )
-        assert result.exit_code == 0
-
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
-    def test_model_flags(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
-        """Should pass model list through to the benchmark."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
-        mock_run.return_value = _make_report()
-
-        result = runner.invoke(
-            app,
-            [
-                "benchmark",
-                str(f),
-                "-b",
-                "TestBrand",
-                "-m",
-                "gpt-4o",
-                "-m",
-                "gpt-4o-mini",
-                "-y",
-            ],
-        )
-        assert result.exit_code == 0
-
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
-    def test_runs_flag(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
-        """Should pass runs_per_model through."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
-        mock_run.return_value = _make_report()
-
-        result = runner.invoke(
-            app,
-            ["benchmark", str(f), "-b", "TestBrand", "-r", "5", "-y"],
-        )
-        assert result.exit_code == 0
-
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
-    def test_cost_display(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
+    @pytest.mark.parametrize(
+        ("extra_args", "contains", "forwarded"),
+        [
+            pytest.param([], ("TestBrand", "75"), {}, id="rich-brand-mention-rate"),
+            pytest.param([], ("$",), {}, id="rich-cost"),
+            pytest.param([], ("best brand?",), {}, id="rich-per-prompt"),
+            pytest.param(
+                ["-c", "CompA", "-c", "CompB", "--json"],
+                ('"brand"',),
+                {"competitors": ["CompA", "CompB"]},
+                id="competitors",
+            ),
+            pytest.param(
+                ["-m", "gpt-4o", "-m", "gpt-4o-mini"],
+                ("TestBrand",),
+                {"models": ["gpt-4o", "gpt-4o-mini"]},
+                id="models",
+            ),
+            pytest.param(["-r", "5"], ("TestBrand",), {"runs_per_model": 5}, id="runs"),
+        ],
+    )
+    def test_cli_flow(
+        self,
+        mock_pipeline: SimpleNamespace,
+        prompts_file: Path,
+        extra_args: list[str],
+        contains: tuple[str, ...],
+        forwarded: dict[str, object],
     ) -> None:
-        """Should show estimated cost in Rich output."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
-        mock_run.return_value = _make_report()
-
+        """Flags reach the BenchmarkConfig and the report is rendered."""
         result = runner.invoke(
             app,
-            ["benchmark", str(f), "-b", "TestBrand", "-y"],
+            ["benchmark", str(prompts_file), "-b", "TestBrand", *extra_args, "-y"],
         )
         assert result.exit_code == 0
-        assert "$" in result.output
-
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
-    def test_exception_handling(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
-        """Should handle exceptions gracefully."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
-        mock_run.side_effect = RuntimeError("API error")
-
-        result = runner.invoke(
-            app,
-            ["benchmark", str(f), "-b", "TestBrand", "-y"],
-        )
-        assert result.exit_code != 0
+        for text in contains:
+            assert text in result.output
+        config = mock_pipeline.run.call_args.args[0]
+        for field, expected in forwarded.items():
+            assert getattr(config, field) == expected
 
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
     def test_rich_output_per_model(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
+        self, mock_pipeline: SimpleNamespace, prompts_file: Path
     ) -> None:
-        """Rich output should include per-model summaries."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
+        """Rich output should include a summary line for every model."""
         report = _make_report()
         report.model_summaries.append(
-            ModelBenchmarkSummary(
+            ModelBenchmarkSummary.model_construct(
                 model="gpt-4o",
                 mention_rate=0.9,
                 recommendation_rate=0.7,
                 sentiment_breakdown={"positive": 4, "neutral": 1, "negative": 0},
             )
         )
-        mock_run.return_value = report
+        mock_pipeline.run.return_value = report
 
         result = runner.invoke(
             app,
-            ["benchmark", str(f), "-b", "TestBrand", "-y"],
+            ["benchmark", str(prompts_file), "-b", "TestBrand", "-y"],
         )
         assert result.exit_code == 0
-        assert "gpt-4o-mini" in result.output
-
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
-    def test_rich_output_per_prompt(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
-    ) -> None:
-        """Rich output should include per-prompt results."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
-        mock_run.return_value = _make_report()
+        assert "gpt-4o-mini: mention=75%" in result.output
+        assert "gpt-4o: mention=90%" in result.output
 
+    def test_json_output(self, mock_pipeline: SimpleNamespace, prompts_file: Path) -> None:
+        """Should output valid JSON when --json is passed."""
         result = runner.invoke(
             app,
-            ["benchmark", str(f), "-b", "TestBrand", "-y"],
+            ["benchmark", str(prompts_file), "-b", "TestBrand", "-y", "--json"],
         )
         assert result.exit_code == 0
-        assert "best brand?" in result.output
+        data = json.loads(result.output)
+        assert data["config"]["brand"] == "TestBrand"
+        assert "overall_mention_rate" in data
+
+    def test_exception_handling(self, mock_pipeline: SimpleNamespace, prompts_file: Path) -> None:
+        """Should handle exceptions gracefully."""
+        mock_pipeline.run.side_effect = RuntimeError("API error")
+
+        result = runner.invoke(
+            app,
+            ["benchmark", str(prompts_file), "-b", "TestBrand", "-y"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code != 0
 
 
 class TestBenchmarkCLICostConfirmation:
     """Tests for the cost confirmation prompt."""
 
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
     def test_cost_confirmation_abort(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
+        self, mock_pipeline: SimpleNamespace, prompts_file: Path
     ) -> None:
         """Should abort if user declines the cost confirmation."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
-        mock_run.return_value = _make_report()
 
         runner.invoke(
             app,
-            ["benchmark", str(f), "-b", "TestBrand"],
+            ["benchmark", str(prompts_file), "-b", "TestBrand"],
             input="n\n",
+            catch_exceptions=False,
         )
         # Should abort (exit code != 0 or not run)
-        mock_run.assert_not_called()
+        mock_pipeline.run.assert_not_called()
 
-    @patch("context_cli.cli.benchmark._run_benchmark")
-    @patch("context_cli.core.benchmark.loader.load_prompts")
     def test_cost_confirmation_proceed(
-        self, mock_load: MagicMock, mock_run: MagicMock, tmp_path: Path
+        self, mock_pipeline: SimpleNamespace, prompts_file: Path
     ) -> None:
         """Should proceed if user confirms the cost."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
-        mock_load.return_value = _make_prompts()
-        mock_run.return_value = _make_report()
-
         result = runner.invoke(
             app,
-            ["benchmark", str(f), "-b", "TestBrand"],
+            ["benchmark", str(prompts_file), "-b", "TestBrand"],
             input="y\n",
         )
         assert result.exit_code == 0
-        mock_run.assert_called_once()
+        mock_pipeline.run.assert_called_once()
 
 
 class TestBenchmarkCLILitellmImportError:
     """Tests for litellm import error handling."""
 
-    @patch(
-        "context_cli.core.benchmark.loader.load_prompts",
-        side_effect=ImportError("No module named 'litellm'"),
-    )
     def test_litellm_import_error_on_call(
-        self, mock_load: MagicMock, tmp_path: Path
+        self, mock_pipeline: SimpleNamespace, prompts_file: Path
     ) -> None:
         """Should show install instructions when load_prompts raises ImportError."""
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
+        mock_pipeline.load.side_effect = ImportError("No module named 'litellm'")
 
         result = runner.invoke(
             app,
-            ["benchmark", str(f), "-b", "TestBrand", "-y"],
+            ["benchmark", str(prompts_file), "-b", "TestBrand", "-y"],
         )
         assert result.exit_code != 0
         assert "litellm" in result.output.lower() or "install" in result.output.lower()
 
-    def test_litellm_import_error_on_module(self, tmp_path: Path) -> None:
+    def test_litellm_import_error_on_module(
+        self, monkeypatch: pytest.MonkeyPatch, prompts_file: Path
+    ) -> None:
         """Should show install instructions when loader module can't be imported."""
-        import builtins
-
-        f = tmp_path / "prompts.txt"
-        f.write_text("best brand?")
+        # A None entry in sys.modules makes the import fail with ImportError.
+        monkeypatch.setitem(sys.modules, "context_cli.core.benchmark.loader", None)
 
-        original_import = builtins.__import__
-
-        def mock_import(name: str, *args: object, **kwargs: object) -> object:
-            if name == "context_cli.core.benchmark.loader":
-                raise ImportError("No module named 'litellm'")
-            return original_import(name, *args, **kwargs)
-
-        with patch("builtins.__import__", side_effect=mock_import):
-            result = runner.invoke(
-                app,
-                ["benchmark", str(f), "-b", "TestBrand", "-y"],
-            )
+        result = runner.invoke(
+            app,
+            ["benchmark", str(prompts_file), "-b", "TestBrand", "-y"],
+        )
         assert result.exit_code != 0
+        assert "install" in result.output.lower()
 
 
 class TestRunBenchmarkFunction:
     """Tests for _run_benchmark() to cover the function body directly."""
 
-    @patch("context_cli.core.benchmark.metrics.compute_report")
-    @patch("context_cli.core.benchmark.judge.judge_all", new_callable=AsyncMock)
-    @patch("context_cli.core.benchmark.dispatcher.dispatch_queries", new_callable=AsyncMock)
     def test_run_benchmark_calls_pipeline(
-        self,
-        mock_dispatch: AsyncMock,
-        mock_judge: AsyncMock,
-        mock_compute: MagicMock,
+        self, monkeypatch: pytest.MonkeyPatch, mock_report: BenchmarkReport
     ) -> None:
         """_run_benchmark should call dispatch, judge, and compute in sequence."""
-        from context_cli.cli.benchmark import _run_benchmark
-
-        config = BenchmarkConfig(
+        config = BenchmarkConfig.model_construct(
             prompts=[_pe("p1")], brand="B", models=["gpt-4o-mini"], runs_per_model=1
         )
-        mock_dispatch.return_value = ["result1"]
-        mock_judge.return_value = ["judged1"]
-        mock_compute.return_value = _make_report()
+        mock_dispatch = AsyncMock(return_value=["result1"])
+        mock_judge = AsyncMock(return_value=["judged1"])
+        mock_compute = MagicMock(return_value=mock_report)
+        monkeypatch.setattr(dispatcher, "dispatch_queries", mock_dispatch)
+        monkeypatch.setattr(judge, "judge_all", mock_judge)
+        monkeypatch.setattr(metrics, "compute_report", mock_compute)
 
-        report = _run_benchmark(config)
+        report = cli_benchmark._run_benchmark(config)
 
         mock_dispatch.assert_called_once_with(config)
         mock_judge.assert_called_once_with(["result1"], "B", [])
@@ -412,65 +342,22 @@ class TestRunBenchmarkFunction:
 class TestBenchmarkMCPTool:
     """Tests for the benchmark MCP tool in server.py."""
 
-    @pytest.mark.asyncio
-    async def test_mcp_benchmark_tool(self) -> None:
+    async def test_mcp_benchmark_tool(self, mock_pipeline: SimpleNamespace) -> None:
         """MCP benchmark tool should accept prompts list and return dict."""
-        from context_cli.server import benchmark_tool
-
-        # FastMCP 2.x wraps @mcp.tool functions in FunctionTool; access via .fn
-        _bench_fn = benchmark_tool.fn if hasattr(benchmark_tool, "fn") else benchmark_tool
-
-        with (
-            patch(
-                "context_cli.core.benchmark.dispatcher.dispatch_queries",
-                new_callable=AsyncMock,
-                return_value=["response1"],
-            ),
-            patch(
-                "context_cli.core.benchmark.judge.judge_all",
-                new_callable=AsyncMock,
-                return_value=[],
-            ),
-            patch(
-                "context_cli.core.benchmark.metrics.compute_report",
-                return_value=_make_report(),
-            ),
-        ):
-            result = await _bench_fn(
-                prompts=["best brand?"],
-                brand="TestBrand",
-                competitors=["CompA"],
-                models=["gpt-4o-mini"],
-                runs_per_model=1,
-            )
+        result = await _bench_fn(
+            prompts=["best brand?"],
+            brand="TestBrand",
+            competitors=["CompA"],
+            models=["gpt-4o-mini"],
+            runs_per_model=1,
+        )
         assert isinstance(result, dict)
         assert result["config"]["brand"] == "TestBrand"
 
-    @pytest.mark.asyncio
-    async def test_mcp_benchmark_defaults(self) -> None:
+    async def test_mcp_benchmark_defaults(self, mock_pipeline: SimpleNamespace) -> None:
         """MCP tool should work with default parameters."""
-        from context_cli.server import benchmark_tool
-
-        _bench_fn = benchmark_tool.fn if hasattr(benchmark_tool, "fn") else benchmark_tool
-
-        with (
-            patch(
-                "context_cli.core.benchmark.dispatcher.dispatch_queries",
-                new_callable=AsyncMock,
-                return_value=["response1"],
-            ),
-            patch(
-                "context_cli.core.benchmark.judge.judge_all",
-                new_callable=AsyncMock,
-                return_value=[],
-            ),
-            patch(
-                "context_cli.core.benchmark.metrics.compute_report",
-                return_value=_make_report(),
-            ),
-        ):
-            result = await _bench_fn(
-                prompts=["q1"],
-                brand="TestBrand",
-            )
+        result = await _bench_fn(
+            prompts=["q1"],
+            brand="TestBrand",
+        )
         assert isinstance(result, dict)
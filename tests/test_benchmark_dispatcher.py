@@ -2,158 +2,107 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
 from context_cli.core.benchmark.dispatcher import dispatch_queries
 from context_cli.core.models import BenchmarkConfig, PromptBenchmarkResult, PromptEntry
+from tests._fakes import FakeAcompletion, LitellmStub, completion_response
 
+# Shared by the tests that only count or inspect results, never the response body.
+_DEFAULT_RESP = completion_response("Response")
 
-def _make_mock_response(content: str = "Test response") -> MagicMock:
-    """Create a mock litellm response with given content."""
-    mock = MagicMock()
-    mock.choices = [MagicMock(message=MagicMock(content=content))]
-    return mock
+
+_LAPTOP = PromptEntry(prompt="Best laptop?")
+_PHONE = PromptEntry(prompt="Best phone?")
+_LAPTOP_TAGGED = PromptEntry(prompt="Best laptop?", category="comparison", intent="transactional")
+_MINI = "gpt-4o-mini"
+_HAIKU = "claude-3-haiku-20240307"
+# Read-only: dispatch_queries never mutates its config.
+_SINGLE_QUERY = BenchmarkConfig(
+    brand="TestBrand", prompts=[_LAPTOP], models=[_MINI], runs_per_model=1
+)
 
 
 class TestDispatchQueries:
     """Tests for dispatch_queries — the core dispatcher function."""
 
-    @pytest.mark.asyncio
-    async def test_single_prompt_single_model_single_run(self) -> None:
-        """Dispatches one query for one prompt, one model, one run."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[PromptEntry(prompt="Best laptop?")],
-            models=["gpt-4o-mini"],
-            runs_per_model=1,
-        )
-        mock_resp = _make_mock_response("I recommend TestBrand laptops.")
-        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp):
-            results = await dispatch_queries(config)
-
-        assert len(results) == 1
-        assert isinstance(results[0], PromptBenchmarkResult)
-        assert results[0].prompt.prompt == "Best laptop?"
-        assert results[0].model == "gpt-4o-mini"
-        assert results[0].run_index == 0
-        assert results[0].response_text == "I recommend TestBrand laptops."
-        assert results[0].judge_result is None
-        assert results[0].error is None
-
-    @pytest.mark.asyncio
-    async def test_multiple_prompts(self) -> None:
-        """Dispatches queries for multiple prompts."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[
-                PromptEntry(prompt="Best laptop?"),
-                PromptEntry(prompt="Best phone?"),
-            ],
-            models=["gpt-4o-mini"],
-            runs_per_model=1,
+    @pytest.mark.parametrize(
+        ("prompts", "models", "runs", "expected_len"),
+        [
+            pytest.param([_LAPTOP], [_MINI], 1, 1, id="single"),
+            pytest.param([_LAPTOP, _PHONE], [_MINI], 1, 2, id="multiple-prompts"),
+            pytest.param([_LAPTOP], [_MINI, _HAIKU], 1, 2, id="multiple-models"),
+            pytest.param([_LAPTOP], [_MINI], 3, 3, id="runs-per-model"),
+            pytest.param([_LAPTOP, _PHONE], [_MINI, _HAIKU], 3, 12, id="full-combinatorics"),
+            pytest.param([], [_MINI], 1, 0, id="empty-prompts"),
+            pytest.param([_LAPTOP_TAGGED], [_MINI], 1, 1, id="prompt-entry-preserved"),
+            pytest.param([_LAPTOP], None, None, 3, id="default-config"),
+        ],
+    )
+    async def test_dispatch_combinations(
+        self,
+        acompletion: FakeAcompletion,
+        prompts: list[PromptEntry],
+        models: list[str] | None,
+        runs: int | None,
+        expected_len: int,
+    ) -> None:
+        """One result per (prompt x model x run), response filled in, judge left unset."""
+        overrides: dict[str, Any] = {}
+        if models is not None:
+            overrides["models"] = models
+        if runs is not None:
+            overrides["runs_per_model"] = runs
+        config = BenchmarkConfig(brand="TestBrand", prompts=prompts, **overrides)
+
+        results = await dispatch_queries(config)
+
+        assert len(results) == expected_len
+        assert sorted((r.prompt.prompt, r.model, r.run_index) for r in results) == sorted(
+            (p.prompt, m, i)
+            for p in prompts
+            for m in config.models
+            for i in range(config.runs_per_model)
         )
-        mock_resp = _make_mock_response("Response")
-        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp):
-            results = await dispatch_queries(config)
-
-        assert len(results) == 2
-        prompts_queried = {r.prompt.prompt for r in results}
-        assert prompts_queried == {"Best laptop?", "Best phone?"}
-
-    @pytest.mark.asyncio
-    async def test_multiple_models(self) -> None:
-        """Dispatches queries across multiple models."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[PromptEntry(prompt="Best laptop?")],
-            models=["gpt-4o-mini", "claude-3-haiku-20240307"],
-            runs_per_model=1,
-        )
-        mock_resp = _make_mock_response("Response")
-        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp):
-            results = await dispatch_queries(config)
-
-        assert len(results) == 2
-        models_used = {r.model for r in results}
-        assert models_used == {"gpt-4o-mini", "claude-3-haiku-20240307"}
-
-    @pytest.mark.asyncio
-    async def test_runs_per_model(self) -> None:
-        """Each prompt-model pair is repeated runs_per_model times."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[PromptEntry(prompt="Best laptop?")],
-            models=["gpt-4o-mini"],
-            runs_per_model=3,
-        )
-        mock_resp = _make_mock_response("Response")
-        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp):
-            results = await dispatch_queries(config)
-
-        assert len(results) == 3
-        run_indices = sorted(r.run_index for r in results)
-        assert run_indices == [0, 1, 2]
-        assert all(r.model == "gpt-4o-mini" for r in results)
-
-    @pytest.mark.asyncio
-    async def test_full_combinatorics(self) -> None:
-        """2 prompts x 2 models x 3 runs = 12 results."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[
-                PromptEntry(prompt="Best laptop?"),
-                PromptEntry(prompt="Best phone?"),
-            ],
-            models=["gpt-4o-mini", "claude-3-haiku-20240307"],
-            runs_per_model=3,
-        )
-        mock_resp = _make_mock_response("Response")
-        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp):
-            results = await dispatch_queries(config)
-
-        assert len(results) == 12
-
-    @pytest.mark.asyncio
-    async def test_error_handling(self) -> None:
+        for r in results:
+            assert isinstance(r, PromptBenchmarkResult)
+            # The full PromptEntry (category/intent included) is carried through.
+            assert r.prompt in prompts
+            assert r.response_text == "Response"
+            assert r.error is None
+            # Dispatcher does NOT populate judge_result — that is for the judge agent.
+            assert r.judge_result is None
+
+    async def test_error_handling(self, acompletion: FakeAcompletion) -> None:
         """Failed queries capture error and set response_text to empty."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[PromptEntry(prompt="Best laptop?")],
-            models=["gpt-4o-mini"],
-            runs_per_model=1,
-        )
-        with patch(
-            "litellm.acompletion",
-            new_callable=AsyncMock,
-            side_effect=Exception("API rate limit exceeded"),
-        ):
-            results = await dispatch_queries(config)
+        acompletion.side_effect = Exception("API rate limit exceeded")
+        results = await dispatch_queries(_SINGLE_QUERY)
 
         assert len(results) == 1
         assert results[0].response_text == ""
         assert results[0].error is not None
         assert "API rate limit exceeded" in results[0].error
 
-    @pytest.mark.asyncio
-    async def test_partial_failure(self) -> None:
+    async def test_partial_failure(self, litellm_module: LitellmStub) -> None:
         """Some queries fail while others succeed."""
         config = BenchmarkConfig(
             brand="TestBrand",
-            prompts=[PromptEntry(prompt="Best laptop?")],
+            prompts=[_LAPTOP],
             models=["good-model", "bad-model"],
             runs_per_model=1,
         )
 
-        async def mock_acompletion(**kwargs: object) -> MagicMock:
+        async def mock_acompletion(**kwargs: object) -> SimpleNamespace:
             model = kwargs.get("model", "")
             if model == "bad-model":
                 raise Exception("Model not available")
-            return _make_mock_response("Success")
+            return completion_response("Success")
 
-        with patch("litellm.acompletion", side_effect=mock_acompletion):
-            results = await dispatch_queries(config)
+        litellm_module.acompletion = mock_acompletion
+        results = await dispatch_queries(config)
 
         assert len(results) == 2
         good = [r for r in results if r.error is None]
@@ -165,23 +114,11 @@ class TestDispatchQueries:
         assert bad[0].model == "bad-model"
         assert bad[0].response_text == ""
 
-    @pytest.mark.asyncio
-    async def test_system_prompt_content(self) -> None:
+    async def test_system_prompt_content(self, acompletion: FakeAcompletion) -> None:
         """Verify the system prompt mentions brands and reasoning."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[PromptEntry(prompt="Best laptop?")],
-            models=["gpt-4o-mini"],
-            runs_per_model=1,
-        )
-        mock_resp = _make_mock_response("Response")
-        with patch(
-            "litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp
-        ) as mock_call:
-            await dispatch_queries(config)
+        await dispatch_queries(_SINGLE_QUERY)
 
-        call_args = mock_call.call_args
-        messages = call_args.kwargs["messages"]
+        messages = acompletion.calls[-1]["messages"]
         assert len(messages) == 2
         assert messages[0]["role"] == "system"
         assert "brand" in messages[0]["content"].lower()
@@ -189,56 +126,7 @@ class TestDispatchQueries:
         assert messages[1]["role"] == "user"
         assert messages[1]["content"] == "Best laptop?"
 
-    @pytest.mark.asyncio
-    async def test_judge_result_is_none(self) -> None:
-        """Dispatcher does NOT populate judge_result — that is for the judge agent."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[PromptEntry(prompt="Best laptop?")],
-            models=["gpt-4o-mini"],
-            runs_per_model=1,
-        )
-        mock_resp = _make_mock_response("Response")
-        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp):
-            results = await dispatch_queries(config)
-
-        assert all(r.judge_result is None for r in results)
-
-    @pytest.mark.asyncio
-    async def test_empty_prompts_returns_empty(self) -> None:
-        """Config with no prompts returns empty results list."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[],
-            models=["gpt-4o-mini"],
-            runs_per_model=1,
-        )
-        mock_resp = _make_mock_response("Response")
-        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp):
-            results = await dispatch_queries(config)
-
-        assert results == []
-
-    @pytest.mark.asyncio
-    async def test_prompt_entry_preserved(self) -> None:
-        """The full PromptEntry (with category/intent) is preserved in results."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[
-                PromptEntry(prompt="Best laptop?", category="comparison", intent="transactional"),
-            ],
-            models=["gpt-4o-mini"],
-            runs_per_model=1,
-        )
-        mock_resp = _make_mock_response("Response")
-        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp):
-            results = await dispatch_queries(config)
-
-        assert results[0].prompt.category == "comparison"
-        assert results[0].prompt.intent == "transactional"
-
-    @pytest.mark.asyncio
-    async def test_concurrency_semaphore(self) -> None:
+    async def test_concurrency_semaphore(self, litellm_module: LitellmStub) -> None:
         """Verify that concurrency is limited (semaphore is used)."""
         import asyncio
 
@@ -250,38 +138,26 @@ class TestDispatchQueries:
         )
         max_concurrent = 0
         current_concurrent = 0
-        lock = asyncio.Lock()
 
-        async def mock_acompletion(**kwargs: object) -> MagicMock:
+        async def mock_acompletion(**kwargs: object) -> SimpleNamespace:
+            # Single-threaded loop: the counter needs no lock, and one yield is
+            # enough for every task the semaphore admits to pile up here.
             nonlocal max_concurrent, current_concurrent
-            async with lock:
-                current_concurrent += 1
-                if current_concurrent > max_concurrent:
-                    max_concurrent = current_concurrent
-            await asyncio.sleep(0.01)
-            async with lock:
-                current_concurrent -= 1
-            return _make_mock_response("Response")
+            current_concurrent += 1
+            max_concurrent = max(max_concurrent, current_concurrent)
+            await asyncio.sleep(0)
+            current_concurrent -= 1
+            return _DEFAULT_RESP
 
-        with patch("litellm.acompletion", side_effect=mock_acompletion):
-            results = await dispatch_queries(config)
+        litellm_module.acompletion = mock_acompletion
+        results = await dispatch_queries(config)
 
         assert len(results) == 10
-        # Semaphore should limit concurrency to 5
-        assert max_concurrent <= 5
+        # Semaphore should limit concurrency to exactly 5
+        assert max_concurrent == 5
 
-    @pytest.mark.asyncio
-    async def test_default_config_values(self) -> None:
-        """Default config values work correctly (single model, 3 runs)."""
-        config = BenchmarkConfig(
-            brand="TestBrand",
-            prompts=[PromptEntry(prompt="Best laptop?")],
-        )
+    def test_default_config_values(self) -> None:
+        """Default config is a single model with 3 runs (dispatched in the matrix above)."""
+        config = BenchmarkConfig(brand="TestBrand", prompts=[_LAPTOP])
         assert config.models == ["gpt-4o-mini"]
         assert config.runs_per_model == 3
-
-        mock_resp = _make_mock_response("Response")
-        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp):
-            results = await dispatch_queries(config)
-
-        assert len(results) == 3
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import os
+import io
+from pathlib import Path
 
 import pytest
 
@@ -13,18 +14,14 @@ from context_cli.core.models import PromptEntry
 class TestLoadPromptsCSV:
     """Tests for loading prompts from CSV files."""
 
-    def test_csv_with_all_columns(self, tmp_path: object) -> None:
+    def test_csv_with_all_columns(self) -> None:
         """CSV with prompt,category,intent columns parses correctly."""
         csv_content = (
             "prompt,category,intent\n"
             "What is the best laptop?,comparison,transactional\n"
             "Review of MacBook Pro,review,informational\n"
         )
-        path = os.path.join(str(tmp_path), "prompts.csv")
-        with open(path, "w") as f:
-            f.write(csv_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(csv_content))
 
         assert len(prompts) == 2
         assert prompts[0].prompt == "What is the best laptop?"
@@ -34,68 +31,48 @@ class TestLoadPromptsCSV:
         assert prompts[1].category == "review"
         assert prompts[1].intent == "informational"
 
-    def test_csv_prompt_column_only(self, tmp_path: object) -> None:
+    def test_csv_prompt_column_only(self) -> None:
         """CSV with only prompt column works (category/intent default to None)."""
         csv_content = "prompt\nBest running shoes\nTop headphones 2024\n"
-        path = os.path.join(str(tmp_path), "prompts.csv")
-        with open(path, "w") as f:
-            f.write(csv_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(csv_content))
 
         assert len(prompts) == 2
         assert prompts[0].prompt == "Best running shoes"
         assert prompts[0].category is None
         assert prompts[0].intent is None
 
-    def test_csv_with_partial_columns(self, tmp_path: object) -> None:
+    def test_csv_with_partial_columns(self) -> None:
         """CSV with prompt and category but no intent works."""
         csv_content = "prompt,category\nBest laptop?,comparison\nTop phone?,review\n"
-        path = os.path.join(str(tmp_path), "prompts.csv")
-        with open(path, "w") as f:
-            f.write(csv_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(csv_content))
 
         assert len(prompts) == 2
         assert prompts[0].category == "comparison"
         assert prompts[0].intent is None
 
-    def test_csv_empty_values(self, tmp_path: object) -> None:
+    def test_csv_empty_values(self) -> None:
         """CSV with empty category/intent fields treated as None."""
         csv_content = "prompt,category,intent\nBest laptop?,,\nTop phone?,review,\n"
-        path = os.path.join(str(tmp_path), "prompts.csv")
-        with open(path, "w") as f:
-            f.write(csv_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(csv_content))
 
         assert prompts[0].category is None
         assert prompts[0].intent is None
         assert prompts[1].category == "review"
         assert prompts[1].intent is None
 
-    def test_csv_strips_whitespace(self, tmp_path: object) -> None:
+    def test_csv_strips_whitespace(self) -> None:
         """CSV values are stripped of surrounding whitespace."""
         csv_content = "prompt,category,intent\n  Best laptop?  , comparison , transactional \n"
-        path = os.path.join(str(tmp_path), "prompts.csv")
-        with open(path, "w") as f:
-            f.write(csv_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(csv_content))
 
         assert prompts[0].prompt == "Best laptop?"
         assert prompts[0].category == "comparison"
         assert prompts[0].intent == "transactional"
 
-    def test_csv_skips_empty_rows(self, tmp_path: object) -> None:
+    def test_csv_skips_empty_rows(self) -> None:
         """CSV rows with empty prompt are skipped."""
         csv_content = "prompt,category,intent\nBest laptop?,comparison,transactional\n,,\n\n"
-        path = os.path.join(str(tmp_path), "prompts.csv")
-        with open(path, "w") as f:
-            f.write(csv_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(csv_content))
 
         assert len(prompts) == 1
         assert prompts[0].prompt == "Best laptop?"
@@ -104,51 +81,35 @@ class TestLoadPromptsCSV:
 class TestLoadPromptsText:
     """Tests for loading prompts from plain text files."""
 
-    def test_plain_text_one_per_line(self, tmp_path: object) -> None:
+    def test_plain_text_one_per_line(self) -> None:
         """Plain text file loads one prompt per line."""
         text_content = "What is the best laptop?\nReview of MacBook Pro\nTop headphones 2024\n"
-        path = os.path.join(str(tmp_path), "prompts.txt")
-        with open(path, "w") as f:
-            f.write(text_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(text_content))
 
         assert len(prompts) == 3
         assert prompts[0].prompt == "What is the best laptop?"
         assert prompts[0].category is None
         assert prompts[0].intent is None
 
-    def test_plain_text_strips_whitespace(self, tmp_path: object) -> None:
+    def test_plain_text_strips_whitespace(self) -> None:
         """Plain text lines are stripped of whitespace."""
         text_content = "  Best laptop?  \n  Top phone?  \n"
-        path = os.path.join(str(tmp_path), "prompts.txt")
-        with open(path, "w") as f:
-            f.write(text_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(text_content))
 
         assert prompts[0].prompt == "Best laptop?"
         assert prompts[1].prompt == "Top phone?"
 
-    def test_plain_text_skips_empty_lines(self, tmp_path: object) -> None:
+    def test_plain_text_skips_empty_lines(self) -> None:
         """Empty lines in plain text are skipped."""
         text_content = "Best laptop?\n\n\nTop phone?\n"
-        path = os.path.join(str(tmp_path), "prompts.txt")
-        with open(path, "w") as f:
-            f.write(text_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(text_content))
 
         assert len(prompts) == 2
 
-    def test_plain_text_skips_whitespace_only_lines(self, tmp_path: object) -> None:
+    def test_plain_text_skips_whitespace_only_lines(self) -> None:
         """Lines with only whitespace are treated as empty."""
         text_content = "Best laptop?\n   \n  \nTop phone?\n"
-        path = os.path.join(str(tmp_path), "prompts.txt")
-        with open(path, "w") as f:
-            f.write(text_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(text_content))
 
         assert len(prompts) == 2
 
@@ -161,59 +122,42 @@ class TestLoadPromptsEdgeCases:
         with pytest.raises(FileNotFoundError):
             load_prompts("/nonexistent/path/prompts.csv")
 
-    def test_empty_file_returns_empty_list(self, tmp_path: object) -> None:
+    def test_empty_file_returns_empty_list(self) -> None:
         """Empty file returns empty list."""
-        path = os.path.join(str(tmp_path), "empty.csv")
-        with open(path, "w") as f:
-            f.write("")
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(""))
 
         assert prompts == []
 
-    def test_csv_header_only_returns_empty(self, tmp_path: object) -> None:
+    def test_csv_header_only_returns_empty(self) -> None:
         """CSV with only header row returns empty list."""
-        path = os.path.join(str(tmp_path), "header_only.csv")
-        with open(path, "w") as f:
-            f.write("prompt,category,intent\n")
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO("prompt,category,intent\n"))
 
         assert prompts == []
 
-    def test_detects_csv_by_header(self, tmp_path: object) -> None:
+    def test_detects_csv_by_header(self, tmp_path: Path) -> None:
         """File with 'prompt' in first line is treated as CSV even without .csv extension."""
-        path = os.path.join(str(tmp_path), "prompts.dat")
-        with open(path, "w") as f:
-            f.write("prompt,category\nBest laptop?,comparison\n")
+        path = tmp_path / "prompts.dat"
+        path.write_text("prompt,category\nBest laptop?,comparison\n")
 
         prompts = load_prompts(path)
 
         assert len(prompts) == 1
         assert prompts[0].category == "comparison"
 
-    def test_single_prompt_file(self, tmp_path: object) -> None:
+    def test_single_prompt_file(self) -> None:
         """File with a single prompt works."""
-        path = os.path.join(str(tmp_path), "single.txt")
-        with open(path, "w") as f:
-            f.write("What is the best laptop?\n")
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO("What is the best laptop?\n"))
 
         assert len(prompts) == 1
         assert prompts[0].prompt == "What is the best laptop?"
 
-    def test_csv_with_quoted_fields(self, tmp_path: object) -> None:
+    def test_csv_with_quoted_fields(self) -> None:
         """CSV with quoted fields containing commas parses correctly."""
         csv_content = (
             'prompt,category,intent\n'
             '"Best laptop, phone, or tablet?",comparison,transactional\n'
         )
-        path = os.path.join(str(tmp_path), "quoted.csv")
-        with open(path, "w") as f:
-            f.write(csv_content)
-
-        prompts = load_prompts(path)
+        prompts = load_prompts(io.StringIO(csv_content))
 
         assert len(prompts) == 1
         assert prompts[0].prompt == "Best laptop, phone, or tablet?"
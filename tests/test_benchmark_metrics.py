@@ -15,8 +15,8 @@ from context_cli.core.models import (
 
 
 def _pe(text: str) -> PromptEntry:
-    """Shorthand to create a PromptEntry."""
-    return PromptEntry(prompt=text)
+    """Shorthand to create a PromptEntry (known-valid, so built with model_construct())."""
+    return PromptEntry.model_construct(prompt=text)
 
 
 def _make_result(
@@ -28,19 +28,25 @@ def _make_result(
     sentiment: str = "neutral",
     error: str | None = None,
 ) -> PromptBenchmarkResult:
-    """Build a PromptBenchmarkResult with JudgeResult."""
-    judge = JudgeResult(
-        brands_mentioned=brands or [],
-        recommended_brand=recommended,
-        target_brand_position=position,
-        sentiment=sentiment,
-    )
-    return PromptBenchmarkResult(
+    """Build a PromptBenchmarkResult with JudgeResult.
+
+    Hand-written, known-valid data, so both models are built with model_construct()
+    to skip validation; errored results get no JudgeResult at all.
+    """
+    judge = None
+    if not error:
+        judge = JudgeResult.model_construct(
+            brands_mentioned=brands or [],
+            recommended_brand=recommended,
+            target_brand_position=position,
+            sentiment=sentiment,
+        )
+    return PromptBenchmarkResult.model_construct(
         prompt=_pe(prompt),
         model=model,
         run_index=0,
         response_text=f"Response for {prompt}",
-        judge_result=None if error else judge,
+        judge_result=judge,
         error=error,
     )
 
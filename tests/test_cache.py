@@ -78,3 +78,29 @@ def test_cache_multiple_domains():
 
     assert ex is not None and ex[0].detail == "ex"
     assert ot is not None and ot[0].detail == "ot"
+
+
+def test_cache_evicts_least_recently_used():
+    """A full cache should drop the least recently used domain."""
+    cache = RobotsCache(maxsize=2)
+    cache.set("a.com", RobotsReport(found=True), None)
+    cache.set("b.com", RobotsReport(found=True), None)
+    cache.get("a.com")  # a.com is now the most recently used
+
+    cache.set("c.com", RobotsReport(found=True), None)
+
+    assert cache.has("a.com") is True
+    assert cache.has("b.com") is False
+    assert cache.has("c.com") is True
+
+
+def test_cache_overwrite_does_not_evict():
+    """Re-setting a cached domain should not count against maxsize."""
+    cache = RobotsCache(maxsize=2)
+    cache.set("a.com", RobotsReport(found=True), None)
+    cache.set("b.com", RobotsReport(found=True), None)
+
+    cache.set("a.com", RobotsReport(found=False), None)
+
+    assert cache.has("a.com") is True
+    assert cache.has("b.com") is True
@@ -138,3 +138,31 @@ def test_audit_max_pages_flag():
 
     assert result.exit_code == 0
     assert calls == [5]
+
+
+def test_commands_are_imported_lazily():
+    """Importing the app loads no cli/ modules; resolving a command loads only its own."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from typer.main import get_command\n"
+        "from context_cli.main import app\n"
+        "assert 'context_cli.cli.audit' not in sys.modules\n"
+        "group = get_command(app)\n"
+        "assert group.get_command(None, 'generate-batch') is not None\n"
+        "assert group.get_command(None, 'no-such-command') is None\n"
+        "assert 'context_cli.cli.generate' in sys.modules\n"
+        "assert 'context_cli.cli.serve' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_help_lists_all_commands():
+    """Top-level --help still lists every lazily-registered command."""
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for name in ("lint", "benchmark", "generate-batch", "serve", "watch"):
+        assert name in result.output
@@ -312,6 +312,45 @@ class TestGenerateBatch:
         assert result.succeeded == 6
         assert max_concurrent <= 2
 
+    async def test_shared_limit_bounds_concurrent_batches(self, tmp_path):
+        """A shared semaphore caps in-flight generations across batches."""
+        import asyncio
+
+        from context_cli.core.generate.batch import generate_batch
+
+        configs = [
+            BatchGenerateConfig(
+                urls=[f"https://{name}{i}.com" for i in range(3)],
+                model="gpt-4o-mini",
+                output_dir=str(tmp_path / name),
+                concurrency=3,
+            )
+            for name in ("a", "b")
+        ]
+
+        max_concurrent = 0
+        current_concurrent = 0
+
+        async def mock_generate(cfg: GenerateConfig) -> GenerateResult:
+            nonlocal max_concurrent, current_concurrent
+            current_concurrent += 1
+            max_concurrent = max(max_concurrent, current_concurrent)
+            await asyncio.sleep(0.01)  # simulate work
+            current_concurrent -= 1
+            return _make_generate_result(cfg.url, cfg.output_dir)
+
+        shared = asyncio.Semaphore(2)
+        with patch(
+            "context_cli.core.generate.batch.generate_assets",
+            side_effect=mock_generate,
+        ):
+            results = await asyncio.gather(
+                *(generate_batch(cfg, shared_limit=shared) for cfg in configs)
+            )
+
+        assert [r.succeeded for r in results] == [3, 3]
+        assert max_concurrent == 2
+
     async def test_output_dir_per_url(self, tmp_path):
         """Each URL gets its own subdirectory in output_dir."""
         from context_cli.core.generate.batch import generate_batch
@@ -338,6 +338,17 @@ async def test_mcp_generate_batch_returns_dict():
     assert len(result["results"]) == 2
 
 
+@pytest.mark.asyncio
+async def test_mcp_generate_batch_returns_json_native_values():
+    """MCP results are dumped in JSON mode, so enums arrive as plain strings."""
+    with patch(_PATCH_TARGET, new_callable=AsyncMock) as mock_gen:
+        mock_gen.return_value = _mock_batch_result()
+        result = await _mcp_fn(urls=["https://example.com"])
+
+    assert type(result["profile"]) is str
+    assert json.loads(json.dumps(result)) == result
+
+
 @pytest.mark.asyncio
 async def test_mcp_generate_batch_passes_config():
     """MCP generate_batch_tool should pass all params to config."""
@@ -371,3 +382,54 @@ async def test_mcp_generate_batch_default_params():
     assert config.model is None
     assert config.output_dir == "./context-output"
     assert config.concurrency == 3
+
+
+@pytest.mark.asyncio
+async def test_mcp_generate_batch_no_shared_limit_by_default():
+    """Without the env var, a call is bounded only by its own concurrency."""
+    with patch(_PATCH_TARGET, new_callable=AsyncMock) as mock_gen:
+        mock_gen.return_value = _mock_batch_result()
+        await _mcp_fn(urls=["https://example.com"], concurrency=10)
+
+    assert mock_gen.call_args.kwargs["shared_limit"] is None
+    assert mock_gen.call_args[0][0].concurrency == 10
+
+
+@pytest.mark.asyncio
+async def test_mcp_generate_batch_shares_limit_across_calls(monkeypatch):
+    """Every MCP batch call should draw from the same server-wide limit."""
+    import asyncio
+
+    from context_cli import server
+
+    shared = asyncio.Semaphore(4)
+    monkeypatch.setattr(server, "_generate_limit", shared)
+    with patch(_PATCH_TARGET, new_callable=AsyncMock) as mock_gen:
+        mock_gen.return_value = _mock_batch_result()
+        await _mcp_fn(urls=["https://example.com"])
+        await _mcp_fn(urls=["https://example.org"])
+
+    limits = [call.kwargs["shared_limit"] for call in mock_gen.call_args_list]
+    assert limits == [shared, shared]
+
+
+@pytest.mark.parametrize("value", [None, "", "0", "-2", "eight", "\u00b2"])
+def test_generation_limit_from_env_unset_or_invalid(monkeypatch, value):
+    """Missing or non-positive CONTEXT_CLI_MAX_GENERATIONS disables the limit."""
+    from context_cli import server
+
+    if value is None:
+        monkeypatch.delenv("CONTEXT_CLI_MAX_GENERATIONS", raising=False)
+    else:
+        monkeypatch.setenv("CONTEXT_CLI_MAX_GENERATIONS", value)
+    assert server._generation_limit_from_env() is None
+
+
+def test_generation_limit_from_env_positive(monkeypatch):
+    """A positive CONTEXT_CLI_MAX_GENERATIONS sizes the shared semaphore."""
+    from context_cli import server
+
+    monkeypatch.setenv("CONTEXT_CLI_MAX_GENERATIONS", " 5 ")
+    limit = server._generation_limit_from_env()
+    assert limit is not None
+    assert limit._value == 5
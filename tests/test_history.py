@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 
+from context_cli.core import history
 from context_cli.core.history import DEFAULT_DB_PATH, HistoryDB, HistoryEntry
 from context_cli.core.models import (
     AuditReport,
@@ -126,6 +127,59 @@ def test_list_entries_respects_limit(db: HistoryDB) -> None:
     assert len(entries) == 3
 
 
+# ── list_entries_batch ──────────────────────────────────────────────────────
+
+
+def test_list_entries_batch_groups_by_url(db: HistoryDB) -> None:
+    db.save(_make_report(_URL, score=50.0))
+    db.save(_make_report(_URL_B, score=40.0))
+    db.save(_make_report(_URL, score=60.0))
+    grouped = db.list_entries_batch([_URL, _URL_B])
+    assert [e.overall_score for e in grouped[_URL]] == [60.0, 50.0]
+    assert [e.overall_score for e in grouped[_URL_B]] == [40.0]
+
+
+def test_list_entries_batch_limits_per_url(db: HistoryDB) -> None:
+    for i in range(4):
+        db.save(_make_report(_URL, score=float(i)))
+        db.save(_make_report(_URL_B, score=float(i)))
+    grouped = db.list_entries_batch([_URL, _URL_B], limit=2)
+    assert grouped[_URL] == db.list_entries(_URL, limit=2)
+    assert grouped[_URL_B] == db.list_entries(_URL_B, limit=2)
+
+
+def test_list_entries_batch_includes_urls_without_history(db: HistoryDB) -> None:
+    db.save(_make_report(_URL))
+    grouped = db.list_entries_batch([_URL, _URL_B, _URL])
+    assert list(grouped) == [_URL, _URL_B]
+    assert grouped[_URL_B] == []
+
+
+def test_list_entries_batch_empty_urls(db: HistoryDB) -> None:
+    assert db.list_entries_batch([]) == {}
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_list_entries_batch_limit_matches_list_entries(db: HistoryDB, limit: int) -> None:
+    """Zero returns nothing and a negative limit means no limit, as in list_entries."""
+    for i in range(3):
+        db.save(_make_report(_URL, score=float(i)))
+    grouped = db.list_entries_batch([_URL], limit=limit)
+    assert grouped[_URL] == db.list_entries(_URL, limit=limit)
+
+
+def test_list_entries_batch_chunks_large_url_lists(
+    db: HistoryDB, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """URL lists beyond the per-query bound are fetched in several queries."""
+    monkeypatch.setattr(history, "_BATCH_QUERY_URLS", 2)
+    urls = [f"https://example{i}.com" for i in range(5)]
+    for url in urls:
+        db.save(_make_report(url))
+    grouped = db.list_entries_batch(urls)
+    assert [len(grouped[url]) for url in urls] == [1] * 5
+
+
 # ── get_report ──────────────────────────────────────────────────────────────
 
 
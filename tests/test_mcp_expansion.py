@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from context_cli import server
 from context_cli.core.models import (
     AuditReport,
     CompareReport,
@@ -16,11 +17,12 @@ from context_cli.core.models import (
     RobotsReport,
     SchemaReport,
 )
-from context_cli.server import compare, history, recommend
+from context_cli.server import compare, history, history_batch, recommend
 
 # FastMCP 2.x wraps @mcp.tool functions in a FunctionTool object.
 _compare_fn = compare.fn if hasattr(compare, "fn") else compare
 _history_fn = history.fn if hasattr(history, "fn") else history
+_history_batch_fn = history_batch.fn if hasattr(history_batch, "fn") else history_batch
 _recommend_fn = recommend.fn if hasattr(recommend, "fn") else recommend
 
 
@@ -96,6 +98,12 @@ async def test_compare_tool_includes_pillar_deltas(mock_compare):
 # ── History MCP tool ────────────────────────────────────────────────────────
 
 
+@pytest.fixture(autouse=True)
+def _fresh_history_db(monkeypatch):
+    """Each test starts without a shared HistoryDB connection."""
+    monkeypatch.setattr(server, "_history_db", None)
+
+
 @pytest.mark.asyncio
 async def test_history_tool_returns_list(tmp_path):
     """MCP history tool should return a list of entries."""
@@ -165,6 +173,47 @@ async def test_history_tool_default_limit():
         mock_db.list_entries.assert_called_once_with("https://example.com", limit=10)
 
 
+@pytest.mark.asyncio
+async def test_history_tool_reuses_connection():
+    """Repeated history calls share one HistoryDB instead of reopening it."""
+    with patch("context_cli.server.HistoryDB") as MockDB:
+        MockDB.return_value.list_entries.return_value = []
+
+        await _history_fn("https://a.com")
+        await _history_fn("https://b.com")
+
+        MockDB.assert_called_once_with()
+        MockDB.return_value.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_history_batch_tool_returns_entries_per_url(tmp_path):
+    """MCP history_batch tool should map every URL to its serialized entries."""
+    from context_cli.core.history import HistoryDB
+
+    db = HistoryDB(tmp_path / "history.db")
+    db.save(_mock_report("https://a.com", 55.0))
+    with patch("context_cli.server.HistoryDB", return_value=db):
+        result = await _history_batch_fn(["https://a.com", "https://b.com"], limit=5)
+    db.close()
+
+    assert list(result) == ["https://a.com", "https://b.com"]
+    assert result["https://a.com"][0]["overall_score"] == 55.0
+    assert result["https://b.com"] == []
+
+
+def test_close_history_db():
+    """_close_history_db closes the shared connection and is safe to repeat."""
+    mock_db = MagicMock()
+    server._history_db = mock_db
+
+    server._close_history_db()
+    server._close_history_db()
+
+    mock_db.close.assert_called_once_with()
+    assert server._history_db is None
+
+
 # ── Recommend MCP tool ──────────────────────────────────────────────────────
 
 
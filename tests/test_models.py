@@ -7,6 +7,7 @@ from context_cli.core.models import (
     AuditReport,
     BotAccessResult,
     ContentReport,
+    Diagnostic,
     LintCheck,
     LintResult,
     LlmsTxtReport,
@@ -80,6 +81,50 @@ def test_json_roundtrip():
     assert restored.schema_org.schemas[0].schema_type == "Organization"
 
 
+def test_robots_allowed_count():
+    """allowed_count tallies allowed bots and is not part of the serialized model."""
+    robots = RobotsReport(
+        found=True,
+        bots=[
+            BotAccessResult(bot="GPTBot", allowed=True),
+            BotAccessResult(bot="ClaudeBot", allowed=False),
+            BotAccessResult(bot="PerplexityBot", allowed=True),
+        ],
+    )
+    assert robots.allowed_count == 2
+    assert "allowed_count" not in robots.model_dump()
+
+
+def test_schema_unique_types():
+    """unique_types deduplicates @type values across blocks."""
+    schema = SchemaReport(
+        blocks_found=3,
+        schemas=[
+            SchemaOrgResult(schema_type="Article"),
+            SchemaOrgResult(schema_type="Organization"),
+            SchemaOrgResult(schema_type="Article"),
+        ],
+    )
+    assert schema.unique_types == frozenset({"Article", "Organization"})
+    assert SchemaReport().unique_types == frozenset()
+
+
+@pytest.mark.parametrize(
+    "leaf, field, value",
+    [
+        (BotAccessResult(bot="GPTBot", allowed=True), "allowed", False),
+        (SchemaOrgResult(schema_type="Article"), "schema_type", "FAQPage"),
+        (LintCheck(name="AI Primitives", passed=True), "passed", False),
+        (Diagnostic(code="WARN-001", severity="warn", message="m"), "message", "x"),
+    ],
+)
+def test_leaf_models_are_frozen(leaf, field, value):
+    """Leaf result models are immutable; callers replace them via model_copy."""
+    with pytest.raises(ValidationError):
+        setattr(leaf, field, value)
+    assert getattr(leaf.model_copy(update={field: value}), field) == value
+
+
 def test_default_values():
     """Unset optional / default fields should have correct defaults."""
     robots = RobotsReport(found=False)
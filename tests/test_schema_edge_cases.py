@@ -103,3 +103,19 @@ def test_no_at_type():
 
     assert report.blocks_found == 1
     assert report.schemas[0].schema_type == "Unknown"
+
+
+def test_ignores_other_scripts_and_finds_body_jsonld():
+    """Non-JSON-LD scripts are skipped; JSON-LD in <body> is still found."""
+    html = """
+    <html><head>
+    <script type="text/javascript">var x = {"@type": "Fake"};</script>
+    <script>console.log("hi")</script>
+    </head><body><div><p>Text</p>
+    <script type="application/ld+json">{"@type": "Product", "name": "Widget"}</script>
+    </div></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 1
+    assert report.schemas[0].schema_type == "Product"
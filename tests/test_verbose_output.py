@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from io import StringIO
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from rich.console import Console
+from rich.text import Text
 from typer.testing import CliRunner
 
 from context_cli.core.models import (
@@ -23,6 +24,7 @@ from context_cli.core.models import (
     SchemaReport,
     SiteAuditReport,
 )
+from context_cli.formatters import verbose_panels
 from context_cli.formatters.verbose import (
     PILLAR_MAX,
     generate_recommendations,
@@ -38,6 +40,7 @@ from context_cli.formatters.verbose import (
     render_verbose_single,
     render_verbose_site,
     score_color,
+    score_colorer,
 )
 from context_cli.main import app
 
@@ -292,6 +295,23 @@ def test_score_color_content_pillar():
     assert text.style == "green"
 
 
+def test_score_color_is_memoized():
+    """Equal (score, pillar) pairs share one Text; int and float scores stay distinct."""
+    assert score_color(20, "robots") is score_color(20, "robots")
+    assert str(score_color(20, "robots")) == "20"
+    assert str(score_color(20.0, "robots")) == "20.0"
+
+
+def test_score_colorer_is_specialized_per_pillar():
+    """Each pillar gets its own colorer, sharing memoized Text with score_color."""
+    robots = score_colorer("robots")
+    assert robots is score_colorer("robots")
+    assert robots(20.0) is score_color(20.0, "robots")
+    # 20 is green against robots' max of 25 but yellow against content's max of 40
+    assert robots(20.0).style == "green"
+    assert score_colorer("content")(20.0).style == "yellow"
+
+
 def test_overall_color_green():
     assert overall_color(75) == "green"
 
@@ -304,6 +324,14 @@ def test_overall_color_red():
     assert overall_color(20) == "red"
 
 
+def test_color_thresholds_clamped_outside_range():
+    """Ratios outside 0-1 clamp to the red/green ends of the bucket table."""
+    assert verbose_panels._border_color(-5, 25) == "red"
+    assert verbose_panels._border_color(30, 25) == "green"
+    assert verbose_panels._border_color(5, 0) == "red"
+    assert overall_color(150) == "green"
+
+
 def test_pillar_max_values():
     """PILLAR_MAX should match the constants from auditor."""
     assert PILLAR_MAX["robots"] == 25
@@ -333,6 +361,16 @@ def test_robots_verbose_shows_bot_detail_strings():
     assert "Allowed" in text
 
 
+def test_robots_verbose_detail_brackets_render_literally():
+    """Bot details are styled segments, so square brackets are not parsed as markup."""
+    report = _verbose_report()
+    report.robots.bots[0] = report.robots.bots[0].model_copy(
+        update={"detail": "Disallow: /[admin]"}
+    )
+    text = _panel_text(render_robots_verbose(report))
+    assert "Disallow: /[admin]" in text
+
+
 def test_robots_verbose_all_bots_listed():
     """All 13 bots should appear in the robots panel."""
     report = _verbose_report()
@@ -509,6 +547,23 @@ def test_content_verbose_zero_words():
     assert "0" in text
 
 
+def test_content_verbose_active_tier_at_boundaries():
+    """The active tier is the highest threshold the word count reaches."""
+    for word_count, active in [(150, "150+"), (799, "400+"), (800, "800+"), (5000, "1500+")]:
+        report = _minimal_report()
+        report.content.word_count = word_count
+        text = _panel_text(render_content_verbose(report))
+        assert f"→ {active} words" in text
+        assert text.count("(active)") == 1
+        assert "below minimum" not in text
+
+    report = _minimal_report()
+    report.content.word_count = 149
+    text = _panel_text(render_content_verbose(report))
+    assert "(active)" not in text
+    assert "< 150 words = 0 pts (below minimum)" in text
+
+
 def test_content_verbose_high_score_green_border():
     report = _perfect_report()
     panel = render_content_verbose(report)
@@ -961,6 +1016,25 @@ def test_content_usage_verbose_not_found():
     assert "not found" in text.lower() or "No Content-Usage" in text
 
 
+def test_content_usage_verbose_not_found_panel_is_prebuilt():
+    """The header-missing panel is static, so every report gets the same one."""
+    panels = []
+    for _ in range(2):
+        report = _verbose_report()
+        report.content_usage = ContentUsageReport(header_found=False, detail="")
+        panels.append(render_content_usage_verbose(report))
+    assert panels[0] is panels[1]
+
+
+def test_content_usage_verbose_unknown_permissions_render_no():
+    """Unset (None) permissions render as No rather than raising."""
+    report = _verbose_report()
+    report.content_usage = ContentUsageReport(header_found=True, header_value="x", detail="")
+    text = _panel_text(render_content_usage_verbose(report))
+    assert "Yes" not in text
+    assert text.count("No") == 2
+
+
 def test_content_usage_verbose_none_returns_none():
     report = _verbose_report()
     report.content_usage = None
@@ -1092,6 +1166,22 @@ def test_verbose_single_skips_none_informational():
     assert "E-E-A-T" not in output
 
 
+def test_informational_panels_short_circuit_when_no_signals():
+    """No informational signals → the per-signal renderers are never called."""
+    from context_cli.formatters import verbose
+
+    report = _verbose_report()
+    mock_rsl = MagicMock(return_value=None)
+    with patch.object(verbose, "_INFORMATIONAL_PANELS", (("rsl", mock_rsl),)):
+        output = _capture(render_verbose_single, report)
+        mock_rsl.assert_not_called()
+
+        report.rsl = RslReport(detail="none")
+        _capture(render_verbose_single, report)
+        mock_rsl.assert_called_once_with(report)
+    assert "Token Analysis" not in output
+
+
 def test_verbose_site_renders_informational_panels():
     """render_verbose_site should render RSL/Content-Usage/E-E-A-T when present."""
     report = _site_report()
@@ -1137,6 +1227,19 @@ def test_token_analysis_panel_shows_metrics():
     assert "wasted tokens" in text
 
 
+def test_token_analysis_panel_right_aligns_metrics():
+    """Token counts and waste percentage share a right-aligned column."""
+    from context_cli.formatters.verbose_panels import render_token_analysis_verbose
+    report = _verbose_report()
+    report.lint_result = _lint_result()
+    text = _panel_text(render_token_analysis_verbose(report))
+    plain = Text.from_ansi(text).plain.splitlines()
+    raw = next(line for line in plain if "Raw HTML tokens" in line)
+    clean = next(line for line in plain if "Clean MD tokens" in line)
+    waste = next(line for line in plain if "Context Waste" in line)
+    assert raw.index("18,402") + 6 == clean.index("2,760") + 5 == waste.index("85.0%") + 5
+
+
 def test_token_analysis_panel_shows_checks():
     """Token analysis panel should display lint check results."""
     from context_cli.formatters.verbose_panels import render_token_analysis_verbose